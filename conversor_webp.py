@@ -1,9 +1,33 @@
 """Conversor de imagens para formato WebP com interface gráfica."""
+import os
+import queue
 import tkinter as tk
 import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from tkinter import filedialog, ttk, scrolledtext
 from pathlib import Path
-from PIL import Image
+
+from conversor_worker import (
+    CONVERTIDO, ERRO, IGNORADO, EXTENSOES_VALIDAS, MODOS_COMPRESSAO, ImagemDecodificada,
+    OpcoesConversao, decode_one, encode_decoded, encode_lote, formatar_resultado, iter_images,
+)
+
+# Perfis de velocidade do codificador WebP (parâmetro 'method', igual ao -m do cwebp):
+# 0 = mais rápido, 4 = padrão do libwebp, 6 = mais lento/menor arquivo
+METODOS_WEBP = {
+    'Rápido': 0,
+    'Equilibrado': 2,
+    'Máxima compressão': 6,
+}
+
+# Quantidade de arquivos enviada de uma vez para cada processo
+TAMANHO_LOTE_PROCESSOS = 16
+
+# Imagens decodificadas à frente dos codificadores no modo com threads
+MAX_PRE_DECODIFICADAS = 4
+
+# Intervalo (ms) entre as atualizações do log durante a conversão
+INTERVALO_LOG_MS = 50
 
 
 class ConversorWebP:
@@ -12,13 +36,22 @@ class ConversorWebP:
     def __init__(self, root):
         self.root = root
         self.root.title("Conversor de Imagens para WebP")
-        self.root.geometry("700x600")
+        self.root.geometry("700x740")
         self.root.resizable(True, True)
         
         # Variáveis
         self.diretorio_selecionado = tk.StringVar()
         self.qualidade = tk.IntVar(value=80)
+        self.metodo = tk.StringVar(value='Equilibrado')
+        self.usar_processos = tk.BooleanVar(value=False)
+        self.forcar = tk.BooleanVar(value=False)
+        self.max_dim = tk.IntVar(value=0)
+        self.modo = tk.StringVar(value='auto')
+        self.remover_metadados = tk.BooleanVar(value=True)
+        self.tamanho_minimo = tk.IntVar(value=2048)
+        self.manter_menor = tk.BooleanVar(value=False)
         self.convertendo = False
+        self._log_queue = queue.Queue()
 
         # Configurar interface
         self.criar_interface()
@@ -61,22 +94,68 @@ class ConversorWebP:
         # Atualizar label quando o slider muda
         self.qualidade_scale.config(command=self.atualizar_qualidade_label)
 
+        # Perfil de velocidade do codificador
+        ttk.Label(main_frame, text="Velocidade:").grid(row=3, column=0, sticky=tk.W, pady=5)
+        ttk.Combobox(main_frame, textvariable=self.metodo, values=list(METODOS_WEBP),
+                     state='readonly', width=20).grid(row=3, column=1, sticky=tk.W, padx=5, pady=5)
+
+        # Modo de compressão
+        ttk.Label(main_frame, text="Modo de compressão:").grid(row=4, column=0, sticky=tk.W, pady=5)
+        ttk.Combobox(main_frame, textvariable=self.modo, values=MODOS_COMPRESSAO,
+                     state='readonly', width=20).grid(row=4, column=1, sticky=tk.W, padx=5, pady=5)
+
+        # Dimensão máxima (0 = manter o tamanho original)
+        ttk.Label(main_frame, text="Dimensão máxima (px):").grid(row=5, column=0, sticky=tk.W, pady=5)
+        dimensao_frame = ttk.Frame(main_frame)
+        dimensao_frame.grid(row=5, column=1, sticky=(tk.W, tk.E), padx=5, pady=5)
+
+        ttk.Spinbox(dimensao_frame, from_=0, to=20000, increment=100,
+                    textvariable=self.max_dim, width=8).pack(side=tk.LEFT)
+        ttk.Label(dimensao_frame, text="0 = tamanho original").pack(side=tk.LEFT, padx=(10, 0))
+
+        # Tamanho mínimo: arquivos menores são ignorados (WebP tende a ficar maior)
+        ttk.Label(main_frame, text="Tamanho mínimo (bytes):").grid(row=6, column=0, sticky=tk.W, pady=5)
+        tamanho_frame = ttk.Frame(main_frame)
+        tamanho_frame.grid(row=6, column=1, columnspan=2, sticky=(tk.W, tk.E), padx=5, pady=5)
+
+        ttk.Spinbox(tamanho_frame, from_=0, to=1048576, increment=1024,
+                    textvariable=self.tamanho_minimo, width=8).pack(side=tk.LEFT)
+        ttk.Checkbutton(tamanho_frame, text="Manter original se o WebP ficar maior",
+                        variable=self.manter_menor).pack(side=tk.LEFT, padx=(10, 0))
+
+        # Opções adicionais
+        ttk.Label(main_frame, text="Opções:").grid(row=7, column=0, sticky=tk.W, pady=5)
+        opcoes_frame = ttk.Frame(main_frame)
+        opcoes_frame.grid(row=7, column=1, columnspan=2, sticky=(tk.W, tk.E), padx=5, pady=5)
+
+        ttk.Checkbutton(opcoes_frame, text="Usar processos (grandes imagens)",
+                        variable=self.usar_processos).pack(side=tk.LEFT)
+        ttk.Checkbutton(opcoes_frame, text="Forçar reconversão",
+                        variable=self.forcar).pack(side=tk.LEFT, padx=(10, 0))
+        ttk.Checkbutton(opcoes_frame, text="Remover metadados (EXIF/ICC)",
+                        variable=self.remover_metadados).pack(side=tk.LEFT, padx=(10, 0))
+
         # Botão de conversão
         self.btn_converter = ttk.Button(main_frame, text="🚀 Iniciar Conversão",
                                        command=self.iniciar_conversao, style='Accent.TButton')
-        self.btn_converter.grid(row=3, column=0, columnspan=3, pady=20)
+        self.btn_converter.grid(row=8, column=0, columnspan=3, pady=20)
 
         # Barra de progresso
         self.progress = ttk.Progressbar(main_frame, mode='indeterminate')
-        self.progress.grid(row=4, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10))
+        self.progress.grid(row=9, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10))
 
         # Área de log
         ttk.Label(main_frame, text="Log de Conversão:", font=('Arial', 10, 'bold')).grid(
-            row=5, column=0, columnspan=3, sticky=tk.W, pady=(10, 5))
+            row=10, column=0, columnspan=3, sticky=tk.W, pady=(10, 5))
 
-        self.log_area = scrolledtext.ScrolledText(main_frame, height=15, width=70,
-                                                  state='disabled', wrap=tk.WORD)
-        self.log_area.grid(row=6, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
+        self.log_area = scrolledtext.ScrolledText(main_frame, height=15, width=70, wrap=tk.WORD)
+        self.log_area.grid(row=11, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
+
+        # Log somente leitura sem alternar 'state' a cada linha: o widget continua
+        # editável para o código, mas digitação, colar e recortar são bloqueados
+        self.log_area.bind('<Key>', self._bloquear_edicao)
+        for evento in ('<<Paste>>', '<<Cut>>', '<<PasteSelection>>'):
+            self.log_area.bind(evento, lambda e: 'break')
 
         # Configurar tag para cores no log
         self.log_area.tag_config('sucesso', foreground='green')
@@ -85,7 +164,7 @@ class ConversorWebP:
         self.log_area.tag_config('resumo', foreground='purple', font=('Arial', 10, 'bold'))
 
         # Expandir área de log
-        main_frame.rowconfigure(6, weight=1)
+        main_frame.rowconfigure(11, weight=1)
 
     def atualizar_qualidade_label(self, value):
         """Atualiza o label com o valor da qualidade"""
@@ -98,16 +177,51 @@ class ConversorWebP:
             self.diretorio_selecionado.set(diretorio)
             self.adicionar_log(f"📁 Pasta selecionada: {diretorio}", 'info')
 
+    def _bloquear_edicao(self, evento):
+        """Impede a edição do log, mas mantém navegação e Ctrl+C/Ctrl+A"""
+        if evento.state & 0x4 and evento.keysym.lower() in ('c', 'a'):
+            return None
+        if evento.keysym in ('Up', 'Down', 'Left', 'Right', 'Prior', 'Next', 'Home', 'End'):
+            return None
+        return 'break'
+
     def adicionar_log(self, mensagem, tipo='normal'):
         """Adiciona mensagem ao log"""
-        self.log_area.config(state='normal')
+        self._inserir_log(mensagem + '\n', tipo)
+        self.log_area.see(tk.END)  # Auto-scroll
+
+    def _inserir_log(self, texto, tipo):
+        """Insere texto no log com a tag correspondente ao tipo"""
         if tipo != 'normal':
-            self.log_area.insert(tk.END, mensagem + '\n', tipo)
+            self.log_area.insert(tk.END, texto, tipo)
         else:
-            self.log_area.insert(tk.END, mensagem + '\n')
-        self.log_area.see(tk.END)  # Auto-scroll
-        self.log_area.config(state='disabled')
-        self.root.update_idletasks()
+            self.log_area.insert(tk.END, texto)
+
+    def _insert_many(self, pares):
+        """Insere vários (mensagem, tipo), agrupando os consecutivos do mesmo tipo em um único insert"""
+        bloco, tipo_bloco = [], pares[0][1]
+        for mensagem, tipo in pares:
+            if tipo != tipo_bloco:
+                self._inserir_log('\n'.join(bloco) + '\n', tipo_bloco)
+                bloco, tipo_bloco = [], tipo
+            bloco.append(mensagem)
+        self._inserir_log('\n'.join(bloco) + '\n', tipo_bloco)
+
+    def _drain(self):
+        """Descarrega periodicamente a fila de log preenchida pelas threads de conversão"""
+        pendentes = []
+        try:
+            while True:
+                pendentes.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if pendentes:
+            self._insert_many(pendentes)
+            self.log_area.see(tk.END)  # Auto-scroll
+
+        if self.convertendo or not self._log_queue.empty():
+            self.root.after(INTERVALO_LOG_MS, self._drain)
 
     def iniciar_conversao(self):
         """Inicia o processo de conversão em uma thread separada"""
@@ -120,9 +234,7 @@ class ConversorWebP:
             return
 
         # Limpar log anterior
-        self.log_area.config(state='normal')
         self.log_area.delete(1.0, tk.END)
-        self.log_area.config(state='disabled')
 
         # Iniciar conversão em thread separada para não travar a interface
         self.convertendo = True
@@ -131,82 +243,154 @@ class ConversorWebP:
 
         thread = threading.Thread(target=self.converter_imagens, daemon=True)
         thread.start()
+        self.root.after(INTERVALO_LOG_MS, self._drain)
 
     def converter_imagens(self):
         """Converte todas as imagens do diretório e subdiretórios para WebP"""
         try:
             path_origem = Path(self.diretorio_selecionado.get())
-            extensoes_validas = {'.png', '.jpg', '.jpeg'}
-            qualidade = self.qualidade.get()
+            # Prefixo (com separador final) removido para exibir caminhos relativos
+            self._prefixo_len = len(os.path.join(str(path_origem), ''))
+            self._opcoes = OpcoesConversao(
+                qualidade=self.qualidade.get(),
+                metodo=METODOS_WEBP[self.metodo.get()],
+                forcar=self.forcar.get(),
+                max_dim=self.max_dim.get(),
+                modo=self.modo.get(),
+                remover_metadados=self.remover_metadados.get(),
+                tamanho_minimo=self.tamanho_minimo.get(),
+                manter_menor=self.manter_menor.get(),
+            )
 
             # Contadores
             convertidos = 0
+            ignorados = 0
             erros = 0
             total_economia = 0
 
-            self.adicionar_log(f"🚀 Iniciando conversão em: {path_origem.resolve()}", 'info')
-            self.adicionar_log(f"🎯 Qualidade configurada: {qualidade}%", 'info')
-            self.adicionar_log("-" * 70)
-
-            # Percorrer todas as pastas e subpastas recursivamente
-            for arquivo in path_origem.rglob('*'):
-                if arquivo.is_file() and arquivo.suffix.lower() in extensoes_validas:
-                    try:
-                        # Carrega a imagem
-                        with Image.open(arquivo) as img:
-                            # Define o nome de saída (ex: imagem.png -> imagem.webp)
-                            arquivo_saida = arquivo.with_suffix('.webp')
-
-                            # Conversão e Salvamento
-                            # 'optimize=True' força o codificador a tentar achar a melhor estratégia
-                            img.save(arquivo_saida, 'webp', quality=qualidade, optimize=True)
-
-                            # Cálculo de eficiência
-                            tamanho_orig = arquivo.stat().st_size
-                            tamanho_novo = arquivo_saida.stat().st_size
-                            economia = tamanho_orig - tamanho_novo
-
-                            if economia > 0:
-                                total_economia += economia
-                                percentual = (economia / tamanho_orig) * 100
-                                self.adicionar_log(
-                                    f"✅ {arquivo.relative_to(path_origem)} → "
-                                    f"{arquivo_saida.name} ({tamanho_novo/1024:.1f}KB, "
-                                    f"economia: {percentual:.1f}%)",
-                                    'sucesso'
-                                )
-                            else:
-                                self.adicionar_log(
-                                    f"✅ {arquivo.relative_to(path_origem)} → "
-                                    f"{arquivo_saida.name} ({tamanho_novo/1024:.1f}KB)",
-                                    'sucesso'
-                                )
-
-                            convertidos += 1
-
-                    except (OSError, ValueError) as e:
-                        self.adicionar_log(f"❌ Erro ao converter {arquivo.name}: {str(e)}", 'erro')
-                        erros += 1
-
-            # Resumo final
-            self.adicionar_log("-" * 70)
-            self.adicionar_log("🏁 Conversão finalizada!", 'resumo')
-            self.adicionar_log(f"✅ {convertidos} imagens convertidas com sucesso", 'resumo')
+            self._log_thread(f"🚀 Iniciando conversão em: {path_origem.resolve()}", 'info')
+            self._log_thread(f"🎯 Qualidade configurada: {self._opcoes.qualidade}% "
+                             f"| Velocidade: {self.metodo.get()} | Modo: {self._opcoes.modo}", 'info')
+            self._log_thread("-" * 70)
+
+            # Fase 1: coletar as imagens de todas as pastas e subpastas
+            tarefas = list(iter_images(str(path_origem), EXTENSOES_VALIDAS))
+
+            # Maiores primeiro (escalonamento LPT): evita que um arquivo enorme
+            # fique por último enquanto os outros trabalhadores ficam ociosos
+            tarefas.sort(key=lambda tarefa: tarefa[1].st_size, reverse=True)
+
+            # Fase 2: converter em paralelo
+            if self.usar_processos.get():
+                resultados = self._converter_processos(tarefas)
+            else:
+                resultados = self._converter_threads(tarefas)
+
+            for situacao, economia, mensagem, tipo in resultados:
+                self._log_thread(mensagem, tipo)
+                if situacao == CONVERTIDO:
+                    convertidos += 1
+                    total_economia += economia
+                elif situacao == IGNORADO:
+                    ignorados += 1
+                else:
+                    erros += 1
+
+            # Resumo final, enfileirado como um único bloco (um só insert no log)
+            economia_mb = total_economia / 1024 / 1024
+            linhas = ["🏁 Conversão finalizada!",
+                      f"✅ {convertidos} imagens convertidas com sucesso"]
+            if ignorados > 0:
+                linhas.append(f"↷ {ignorados} imagens ignoradas (já atualizadas ou sem ganho)")
             if erros > 0:
-                self.adicionar_log(f"❌ {erros} erros encontrados", 'resumo')
-            self.adicionar_log(
-                f"💾 Espaço economizado: {total_economia / 1024 / 1024:.2f} MB",
-                'resumo'
-            )
+                linhas.append(f"❌ {erros} erros encontrados")
+            linhas.append(f"💾 Espaço economizado: {economia_mb:.2f} MB")
+
+            self._log_thread("-" * 70)
+            self._log_thread('\n'.join(linhas), 'resumo')
 
         except (OSError, ValueError) as e:
-            self.adicionar_log(f"❌ Erro fatal: {str(e)}", 'erro')
+            self._log_thread(f"❌ Erro fatal: {str(e)}", 'erro')
 
         finally:
-            # Restaurar interface
-            self.convertendo = False
-            self.btn_converter.config(state='normal')
-            self.progress.stop()
+            # Restaurar interface (na thread do Tk)
+            self.root.after(0, self.finalizar_conversao)
+
+    def _converter_threads(self, tarefas):
+        """Converte as imagens em threads (o codificador WebP libera o GIL).
+
+        Threads leitoras (uma por núcleo, já que decodificar e redimensionar também
+        pesam) preparam as próximas imagens enquanto as anteriores são codificadas,
+        escondendo a latência do disco; o semáforo limita quantas imagens
+        decodificadas ficam na memória ao mesmo tempo.
+        """
+        trabalhadores = os.cpu_count() or 1
+        vagas = threading.BoundedSemaphore(trabalhadores + MAX_PRE_DECODIFICADAS)
+        resultados = queue.Queue()
+        pendentes = iter(tarefas)
+        trava_pendentes = threading.Lock()
+
+        def concluir(path_str, futuro):
+            vagas.release()
+            try:
+                resultado = futuro.result()
+            except Exception as e:
+                resultado = (path_str, ERRO, 0, 0, str(e))
+            resultados.put(formatar_resultado(resultado, self._prefixo_len))
+
+        with ThreadPoolExecutor(max_workers=trabalhadores) as executor:
+            def leitor():
+                while True:
+                    with trava_pendentes:
+                        tarefa = next(pendentes, None)
+                    if tarefa is None:
+                        return
+                    path_str, stat_orig = tarefa
+                    vagas.acquire()
+                    try:
+                        etapa = decode_one(path_str, self._opcoes, stat_orig)
+                    except Exception as e:
+                        etapa = (path_str, ERRO, 0, 0, str(e))
+                    if isinstance(etapa, ImagemDecodificada):
+                        futuro = executor.submit(encode_decoded, etapa, self._opcoes)
+                        futuro.add_done_callback(lambda f, p=path_str: concluir(p, f))
+                    else:
+                        # Ignorado ou erro de leitura: já é o resultado final
+                        vagas.release()
+                        resultados.put(formatar_resultado(etapa, self._prefixo_len))
+
+            leitores = [threading.Thread(target=leitor, daemon=True)
+                        for _ in range(trabalhadores)]
+            for thread_leitora in leitores:
+                thread_leitora.start()
+            for _ in range(len(tarefas)):
+                yield resultados.get()
+            for thread_leitora in leitores:
+                thread_leitora.join()
+
+    def _converter_processos(self, tarefas):
+        """Converte as imagens em processos, evitando disputa pelo GIL e pelos locks do libwebp"""
+        # As tarefas chegam ordenadas da maior para a menor; distribuí-las em
+        # rodízio dá a cada lote uma mistura de tamanhos, em vez de deixar as 16
+        # maiores juntas no primeiro lote, codificadas uma após a outra
+        n_lotes = -(-len(tarefas) // TAMANHO_LOTE_PROCESSOS)
+        lotes = [tarefas[i::n_lotes] for i in range(n_lotes)]
+
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futuros = [executor.submit(encode_lote, lote, self._opcoes) for lote in lotes]
+            for futuro in as_completed(futuros):
+                for resultado in futuro.result():
+                    yield formatar_resultado(resultado, self._prefixo_len)
+
+    def _log_thread(self, mensagem, tipo='normal'):
+        """Enfileira uma mensagem de log para ser exibida pela thread do Tk"""
+        self._log_queue.put((mensagem, tipo))
+
+    def finalizar_conversao(self):
+        """Restaura a interface após a conversão"""
+        self.convertendo = False
+        self.btn_converter.config(state='normal')
+        self.progress.stop()
 
 
 def main():
@@ -0,0 +1,301 @@
+"""Lógica de conversão por arquivo do conversor WebP, separada da interface Tk.
+
+Este módulo não depende do Tkinter e tem anotações de tipo completas para poder
+ser compilado com mypyc (veja setup.py). Sem compilação, funciona como Python puro.
+"""
+import io
+import os
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, Type, Union
+
+from PIL import Image
+
+try:
+    import webp
+    WEBP_DISPONIVEL = True
+    ERROS_CONVERSAO: Tuple[Type[BaseException], ...] = (OSError, ValueError, webp.WebPError)
+except ImportError:
+    WEBP_DISPONIVEL = False
+    ERROS_CONVERSAO = (OSError, ValueError)
+
+# Modos de compressão: 'auto' escolhe lossless para gráficos e lossy para fotos
+MODOS_COMPRESSAO = ('auto', 'lossy', 'lossless')
+
+# Abaixo desta quantidade de cores (na miniatura) a imagem é tratada como gráfico
+LIMITE_CORES_GRAFICO = 256
+
+# Modos em que Image.getcolors() funciona
+MODOS_GETCOLORS = ('1', 'L', 'P', 'RGB', 'RGBA', 'LA', 'CMYK')
+
+# Extensões aceitas (sem o ponto, em minúsculas) e o formato do Pillow de cada uma
+FORMATOS_POR_EXTENSAO = {'png': 'PNG', 'jpg': 'JPEG', 'jpeg': 'JPEG'}
+EXTENSOES_VALIDAS = frozenset(FORMATOS_POR_EXTENSAO)
+
+# Restringe a detecção do Image.open a esses plugins, sem testar todos os registrados
+FORMATOS_PIL = tuple(sorted(set(FORMATOS_POR_EXTENSAO.values())))
+
+# Buffer de escrita (1 MB) para reduzir o número de write() em saídas grandes
+TAMANHO_BUFFER_ESCRITA = 1024 * 1024
+
+# Situação de cada arquivo processado
+CONVERTIDO = 'convertido'
+IGNORADO = 'ignorado'
+ERRO = 'erro'
+
+# Motivos para ignorar um arquivo sem convertê-lo (None = saída já atualizada)
+MOTIVO_PEQUENO = 'muito pequeno'
+MOTIVO_MAIOR = 'WebP maior que o original'
+
+# (caminho, situação, tamanho_orig, tamanho_novo, erro ou motivo de ter sido ignorado)
+Resultado = Tuple[str, str, int, int, Optional[str]]
+
+
+class OpcoesConversao(NamedTuple):
+    """Parâmetros de conversão enviados às threads/processos trabalhadores.
+
+    NamedTuple (e não dataclass congelada) para continuar serializável com pickle
+    quando o módulo é compilado com mypyc.
+    """
+    qualidade: int
+    metodo: int
+    forcar: bool = False
+    max_dim: int = 0
+    modo: str = 'auto'
+    remover_metadados: bool = True
+    tamanho_minimo: int = 0
+    manter_menor: bool = False
+
+
+def iter_images(raiz: str, extensoes: frozenset) -> Iterator[Tuple[str, os.stat_result]]:
+    """Percorre a pasta recursivamente com os.scandir e gera (caminho, stat) de cada imagem.
+
+    DirEntry.is_file() reaproveita o tipo lido do diretório, evitando um stat() por entrada.
+    """
+    pendentes = [raiz]
+    while pendentes:
+        try:
+            entradas = os.scandir(pendentes.pop())
+        except OSError:
+            continue
+        with entradas:
+            for entrada in entradas:
+                # Uma entrada que some ou não pode ser lida durante a varredura é
+                # ignorada sozinha, sem descartar o resto da pasta
+                try:
+                    if entrada.is_dir(follow_symlinks=False):
+                        pendentes.append(entrada.path)
+                        continue
+                    _, ponto, extensao = entrada.name.rpartition('.')
+                    if not (ponto and extensao.lower() in extensoes
+                            and entrada.is_file(follow_symlinks=False)):
+                        continue
+                    stat_entrada = entrada.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                yield entrada.path, stat_entrada
+
+
+@lru_cache(maxsize=None)
+def config_webp(quality: int, method: int, lossless: bool = False) -> Any:
+    """Cria (uma única vez por combinação) a configuração do pacote webp"""
+    preset = webp.WebPPreset.DRAWING if lossless else webp.WebPPreset.PHOTO
+    return webp.WebPConfig.new(preset=preset, quality=quality, method=method, lossless=lossless)
+
+
+def parece_grafico(img: Image.Image) -> bool:
+    """Heurística barata: poucas cores distintas indicam captura de tela/ícone, não foto.
+
+    Usa uma miniatura de até 128x128 com NEAREST, que não cria cores intermediárias.
+    """
+    escala = max(img.width, img.height) / 128
+    if escala > 1:
+        miniatura = img.resize((max(1, int(img.width / escala)), max(1, int(img.height / escala))),
+                               Image.Resampling.NEAREST)
+    else:
+        miniatura = img
+    # getcolors() não aceita modos como I;16 (PNG 16 bits em tons de cinza)
+    if miniatura.mode not in MODOS_GETCOLORS:
+        miniatura = miniatura.convert('L' if len(miniatura.getbands()) == 1 else 'RGB')
+    cores = miniatura.getcolors(maxcolors=4096)
+    if cores is None:
+        # Mais de 4096 cores: foto
+        return False
+    return (len(cores) < LIMITE_CORES_GRAFICO
+            or (len(cores) < 1024 and miniatura.mode in ('P', 'L')))
+
+
+class ImagemDecodificada(NamedTuple):
+    """Imagem já lida e decodificada, pronta para ser codificada em WebP"""
+    path_str: str
+    arquivo_saida: str
+    tamanho_orig: int
+    img: Image.Image
+    lossless: bool
+
+
+def decode_one(path_str: str, opcoes: OpcoesConversao,
+               stat_orig: Optional[os.stat_result] = None) -> Union[Resultado, ImagemDecodificada]:
+    """Lê e decodifica uma imagem (etapa de E/S da conversão).
+
+    Retorna a ImagemDecodificada, ou o Resultado final quando o arquivo é ignorado
+    ou não pode ser lido. A imagem volta totalmente carregada e com o arquivo fechado,
+    para ser codificada em outra thread.
+    """
+    try:
+        # Os caminhos vêm do iter_images e sempre têm extensão, então basta
+        # fatiar a string em vez de construir objetos Path
+        base, _, extensao = path_str.rpartition('.')
+
+        # Já é WebP: não há o que converter
+        if extensao.lower() == 'webp':
+            return path_str, IGNORADO, 0, 0, None
+
+        # Define o nome de saída (ex: imagem.png -> imagem.webp)
+        arquivo_saida = base + '.webp'
+        if stat_orig is None:
+            stat_orig = os.lstat(path_str)
+
+        # Arquivos muito pequenos (ícones) costumam crescer no WebP por causa do cabeçalho
+        if stat_orig.st_size < opcoes.tamanho_minimo:
+            return path_str, IGNORADO, stat_orig.st_size, 0, MOTIVO_PEQUENO
+
+        # Pula arquivos cuja saída já existe e é mais recente que a origem
+        if not opcoes.forcar:
+            try:
+                stat_saida = os.stat(arquivo_saida)
+            except FileNotFoundError:
+                pass
+            else:
+                if stat_saida.st_mtime >= stat_orig.st_mtime and stat_saida.st_size > 0:
+                    return path_str, IGNORADO, stat_orig.st_size, stat_saida.st_size, None
+
+        # Carrega a imagem
+        with Image.open(path_str, formats=FORMATOS_PIL) as arquivo_img:
+            img: Image.Image = arquivo_img
+
+            # Reduz imagens grandes: em JPEGs o draft() decodifica direto em 1/2, 1/4
+            # ou 1/8 da resolução; o thumbnail() ajusta ao tamanho exato
+            if opcoes.max_dim:
+                limite = (opcoes.max_dim, opcoes.max_dim)
+                img.draft(img.mode, limite)
+                img.thumbnail(limite, Image.Resampling.LANCZOS)
+
+            # copy() força a decodificação completa; fechar o arquivo invalida a original
+            img = img.copy()
+
+        # Escolhe lossless para gráficos e lossy para fotos (no modo automático)
+        if opcoes.modo == 'auto':
+            lossless = parece_grafico(img)
+        else:
+            lossless = opcoes.modo == 'lossless'
+
+        return ImagemDecodificada(path_str, arquivo_saida, stat_orig.st_size, img, lossless)
+
+    except ERROS_CONVERSAO as e:
+        return path_str, ERRO, 0, 0, str(e)
+
+
+def encode_decoded(decodificada: ImagemDecodificada, opcoes: OpcoesConversao) -> Resultado:
+    """Codifica uma imagem já decodificada e grava o arquivo WebP (etapa de CPU da conversão)"""
+    path_str, arquivo_saida, tamanho_orig, img, lossless = decodificada
+    try:
+        # Conversão e Salvamento
+        if WEBP_DISPONIVEL and opcoes.remover_metadados:
+            # Codifica direto no libwebp, sem passar pelo plugin WebP do Pillow.
+            # O WebPPicture não anexa EXIF/ICC, então a remoção de metadados é
+            # automática aqui; para preservá-los usamos o caminho do Pillow
+            if img.mode not in ('RGB', 'RGBA', 'P'):
+                img = img.convert('RGBA' if 'A' in img.getbands() else 'RGB')
+            pic = webp.WebPPicture.from_pil(img)
+            # Any: buffer() devolve um buffer do cffi, embora o pacote webp o anote
+            # como bytes (o mypyc verificaria o tipo e rejeitaria o valor)
+            dados: Any = pic.encode(config_webp(opcoes.qualidade, opcoes.metodo, lossless))
+            buf = dados.buffer()
+            if opcoes.manter_menor and len(buf) >= tamanho_orig:
+                return path_str, IGNORADO, tamanho_orig, len(buf), MOTIVO_MAIOR
+            with open(arquivo_saida, 'wb', buffering=TAMANHO_BUFFER_ESCRITA) as f:
+                f.write(buf)
+            tamanho_novo = len(buf)
+        else:
+            # EXIF/ICC só são gravados quando o usuário pede para preservá-los
+            if opcoes.remover_metadados:
+                img.info.pop('icc_profile', None)
+                img.info.pop('exif', None)
+                metadados = {'exif': b'', 'icc_profile': None}
+            else:
+                metadados = {'exif': img.info.get('exif', b''),
+                             'icc_profile': img.info.get('icc_profile')}
+
+            # 'optimize=True' aciona as buscas mais lentas do libwebp, então só
+            # vale a pena no perfil de máxima compressão
+            parametros: Dict[str, Any] = dict(
+                quality=opcoes.qualidade, method=opcoes.metodo, lossless=lossless,
+                optimize=opcoes.metodo >= 5, **metadados)
+            if opcoes.manter_menor:
+                # Codifica na memória e compara antes de abrir a saída, como no
+                # caminho do libwebp: um .webp anterior (sobrescrito com forcar)
+                # só é substituído quando o novo resultado é menor
+                memoria = io.BytesIO()
+                img.save(memoria, 'webp', **parametros)
+                tamanho_novo = memoria.tell()
+                if tamanho_novo >= tamanho_orig:
+                    return path_str, IGNORADO, tamanho_orig, tamanho_novo, MOTIVO_MAIOR
+                with open(arquivo_saida, 'wb', buffering=TAMANHO_BUFFER_ESCRITA) as f:
+                    f.write(memoria.getbuffer())
+            else:
+                # O Pillow grava direto no arquivo; o buffer grande agrupa os
+                # vários write() do plugin
+                with open(arquivo_saida, 'wb', buffering=TAMANHO_BUFFER_ESCRITA) as f:
+                    img.save(f, 'webp', **parametros)
+                    tamanho_novo = f.tell()
+
+        # O tamanho novo vem do que foi escrito, sem outro stat() no arquivo de saída
+        return path_str, CONVERTIDO, tamanho_orig, tamanho_novo, None
+
+    except ERROS_CONVERSAO as e:
+        return path_str, ERRO, 0, 0, str(e)
+
+
+def encode_one(path_str: str, opcoes: OpcoesConversao,
+               stat_orig: Optional[os.stat_result] = None) -> Resultado:
+    """Converte uma imagem para WebP e retorna (caminho, situação, tamanho_orig, tamanho_novo, erro).
+
+    Fica no nível do módulo para poder ser enviada a um ProcessPoolExecutor. Recebe o
+    stat já obtido na varredura, quando disponível, para não repetir a chamada.
+    """
+    etapa = decode_one(path_str, opcoes, stat_orig)
+    if isinstance(etapa, ImagemDecodificada):
+        return encode_decoded(etapa, opcoes)
+    return etapa
+
+
+def encode_lote(tarefas: List[Tuple[str, os.stat_result]],
+                opcoes: OpcoesConversao) -> List[Resultado]:
+    """Converte um lote de imagens dentro de um processo trabalhador"""
+    return [encode_one(path_str, opcoes, stat_orig) for path_str, stat_orig in tarefas]
+
+
+def formatar_resultado(resultado: Resultado, prefixo_len: int) -> Tuple[str, int, str, str]:
+    """Transforma o retorno de encode_one em (situação, economia, mensagem, tipo)"""
+    path_str, situacao, tamanho_orig, tamanho_novo, erro = resultado
+
+    if situacao == ERRO:
+        return ERRO, 0, f"❌ Erro ao converter {os.path.basename(path_str)}: {erro}", 'erro'
+
+    relativo = path_str[prefixo_len:]
+    if situacao == IGNORADO:
+        if erro:
+            return IGNORADO, 0, f"↷ ignorado ({erro}): {relativo}", 'info'
+        return IGNORADO, 0, f"↷ {relativo} já convertido", 'info'
+
+    # Cálculo de eficiência
+    nome_saida = os.path.basename(path_str).rpartition('.')[0] + '.webp'
+    economia = tamanho_orig - tamanho_novo
+
+    if economia > 0:
+        percentual = (economia / tamanho_orig) * 100
+        mensagem = (f"✅ {relativo} → {nome_saida} ({tamanho_novo/1024:.1f}KB, "
+                    f"economia: {percentual:.1f}%)")
+    else:
+        mensagem = f"✅ {relativo} → {nome_saida} ({tamanho_novo/1024:.1f}KB)"
+    return CONVERTIDO, max(economia, 0), mensagem, 'sucesso'
@@ -8,33 +8,43 @@ Repository: https://github.com/llleovianna/audio-converter
 License: MIT
 """
 
+import io
 import os
+import re
 import sys
 import json
+import time
+import shutil
 import hashlib
 import threading
+import multiprocessing
 from pathlib import Path
 from datetime import datetime
+from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Dict, Tuple, Iterator, Iterable, Callable
+from itertools import chain, count, islice
+from concurrent.futures import (
+    ThreadPoolExecutor, ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+)
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QLineEdit, QComboBox, QSlider, QProgressBar,
     QTextEdit, QFileDialog, QCheckBox, QGroupBox, QTabWidget,
     QSpinBox, QFrame, QSplitter, QMessageBox, QListWidget,
-    QListWidgetItem, QGridLayout, QScrollArea, QSizePolicy,
+    QGridLayout, QScrollArea, QSizePolicy,
     QStatusBar, QMenu, QAction, QToolBar, QDialog, QDialogButtonBox,
-    QFormLayout, QTableWidget, QTableWidgetItem, QHeaderView
+    QFormLayout, QTableView, QHeaderView
 )
 from PyQt5.QtCore import (
     Qt, QThread, pyqtSignal, QSize, QTimer, QPropertyAnimation,
-    QEasingCurve, QSequentialAnimationGroup, pyqtProperty
+    QEasingCurve, QSequentialAnimationGroup, pyqtProperty,
+    QAbstractTableModel, QModelIndex
 )
 from PyQt5.QtGui import (
     QFont, QIcon, QPalette, QColor, QPixmap, QLinearGradient,
-    QBrush, QPainter, QPen, QFontDatabase
+    QBrush, QPainter, QPen, QFontDatabase, QTextCursor
 )
 
 try:
@@ -44,6 +54,24 @@ except ImportError:
     PIL_AVAILABLE = False
     print("⚠️ Pillow not installed. Run: pip install Pillow")
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import numba
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONSTANTS & CONFIGURATIONS
@@ -53,6 +81,15 @@ APP_NAME = "Image Converter Pro"
 APP_VERSION = "2.0.0"
 GITHUB_URL = "https://github.com/llleovianna/audio-converter"
 
+# Rich text for the Settings tab's About box
+_ABOUT_HTML = (
+    f"<h3>{APP_NAME}</h3>"
+    f"<p>Version: {APP_VERSION}</p>"
+    f"<p>A modern, feature-rich image converter with support for multiple formats.</p>"
+    f"<p><a href='{GITHUB_URL}' style='color: #58a6ff;'>GitHub Repository</a></p>"
+    f"<p>Made with ❤️ by Leonardo Vianna</p>"
+)
+
 # Supported formats configuration
 INPUT_FORMATS = {
     'PNG': ['.png'],
@@ -75,6 +112,67 @@ OUTPUT_FORMATS = {
     'ICO': {'ext': '.ico', 'quality': False, 'optimize': False},
 }
 
+# Precomputed lookups: lowercase extensions without the dot (as matched by the
+# scanner) and the Pillow format name to save each output format with
+INPUT_EXT_SETS = {
+    name: frozenset(ext.lstrip('.').lower() for ext in exts)
+    for name, exts in INPUT_FORMATS.items()
+}
+OUTPUT_FMT_UPPER = {name: name.upper() for name in OUTPUT_FORMATS}
+
+# Extensions the batch tools (rename, duplicate finder, info) work on, in the
+# same form, plus the matching file dialog filter
+_IMAGE_EXT_ORDER = ('png', 'jpg', 'jpeg', 'webp', 'bmp', 'gif', 'tiff')
+IMAGE_EXTS = frozenset(_IMAGE_EXT_ORDER)
+IMAGE_FILE_FILTER = f"Images ({' '.join('*.' + ext for ext in _IMAGE_EXT_ORDER)})"
+
+# Pillow formats whose headers can carry EXIF data worth probing for
+EXIF_FORMATS = frozenset({'JPEG', 'MPO', 'TIFF'})
+
+# Batches smaller than this are converted in threads; a process pool is not
+# worth its startup cost for a handful of files
+PROCESS_POOL_THRESHOLD = 4
+
+# CPUs this process may actually run on (honours affinity masks where available)
+if hasattr(os, 'process_cpu_count'):  # Python 3.13+
+    AVAILABLE_CPUS = os.process_cpu_count() or 4
+elif hasattr(os, 'sched_getaffinity'):
+    AVAILABLE_CPUS = len(os.sched_getaffinity(0)) or 4
+else:
+    AVAILABLE_CPUS = os.cpu_count() or 4
+
+# Decoded size of a typical large input (12 MP RGBA); with "Auto" workers the
+# process pool is capped so each worker has room for about 4 of these
+ESTIMATED_IMAGE_BYTES = 4000 * 3000 * 4
+
+# Duplicate inputs are first matched on size plus a hash of their first and
+# last bytes; larger files are confirmed with a full hash before reusing output
+QUICK_HASH_BYTES = 64 * 1024
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Images at least this large are resized with the parallel Numba kernel (when installed)
+NUMBA_RESIZE_MIN_PIXELS = 4_000_000
+LANCZOS_TAPS = 3
+
+# Worker log lines are sent to the UI in batches of up to this many lines,
+# or at least every LOG_FLUSH_INTERVAL seconds
+LOG_BATCH_SIZE = 32
+LOG_FLUSH_INTERVAL = 0.1
+
+# The log view itself is redrawn at most once per this many milliseconds
+LOG_VIEW_DELAY_MS = 30
+
+# Progress bar and counters are refreshed at most ~30 times a second
+PROGRESS_INTERVAL_MS = 33
+
+# Log colors per message type
+LOG_COLORS = {
+    "info": "#58a6ff",
+    "success": "#3fb950",
+    "error": "#f85149",
+    "warning": "#d29922"
+}
+
 # Modern Dark Theme Stylesheet
 DARK_THEME = """
 QMainWindow {
@@ -374,18 +472,18 @@ QListWidget::item:hover:!selected {
     background-color: #21262d;
 }
 
-QTableWidget {
+QTableView {
     background-color: #0d1117;
     border: 2px solid #30363d;
     border-radius: 12px;
     gridline-color: #21262d;
 }
 
-QTableWidget::item {
+QTableView::item {
     padding: 8px;
 }
 
-QTableWidget::item:selected {
+QTableView::item:selected {
     background-color: #1f6feb;
 }
 
@@ -406,6 +504,10 @@ QToolTip {
 }
 """
 
+# Whitespace-collapsed copy, set once on the QApplication so every window and
+# dialog shares one parsed stylesheet
+_DARK_THEME_MIN = re.sub(r'\s*([{};,])\s*', r'\1', re.sub(r'\s+', ' ', DARK_THEME)).strip()
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # DATA CLASSES
@@ -449,7 +551,607 @@ class ConversionSettings:
     rename_pattern: str = ""
     add_suffix: str = ""
     output_directory: str = ""
-    max_workers: int = 4
+    max_workers: int = 0  # 0 = one per available CPU
+    auto_workers: bool = True
+    png_compress_level: int = 6
+    png_palette: bool = False
+    webp_method: int = 4
+    webp_lossless: bool = False
+    skip_duplicates: bool = True
+    
+    def __post_init__(self):
+        if self.max_workers <= 0:
+            self.max_workers = AVAILABLE_CPUS
+
+
+# Resize modes, chosen once per batch from which dimensions are set
+RESIZE_EXACT, RESIZE_FIT_WIDTH, RESIZE_FIT_HEIGHT, RESIZE_FIT_BOTH = range(4)
+
+
+def _resize_mode(settings: ConversionSettings) -> int:
+    """Pick the resize mode implied by the target dimensions and aspect option."""
+    if settings.maintain_aspect_ratio:
+        if settings.resize_width and settings.resize_height:
+            return RESIZE_FIT_BOTH
+        if settings.resize_width:
+            return RESIZE_FIT_WIDTH
+        if settings.resize_height:
+            return RESIZE_FIT_HEIGHT
+    return RESIZE_EXACT
+
+
+@dataclass(frozen=True)
+class ConversionPlan:
+    """Per-batch parameters derived once from the settings and shared by every file."""
+    settings: ConversionSettings
+    base_dir: str
+    rename_pattern: str
+    pil_format: str
+    save_kwargs: Dict[str, object]
+    resize_mode: int = RESIZE_EXACT
+    
+    @classmethod
+    def from_settings(cls, settings: ConversionSettings, base_dir: str,
+                      now: datetime) -> "ConversionPlan":
+        """Resolve the save arguments and batch-wide rename tokens for a conversion run."""
+        output_format = settings.output_format
+        format_config = OUTPUT_FORMATS[output_format]
+        save_kwargs = {}
+        
+        if format_config['quality'] and output_format != 'PNG':
+            save_kwargs['quality'] = settings.quality
+        
+        if format_config['optimize'] and settings.apply_optimization:
+            save_kwargs['optimize'] = True
+        
+        # WebP specific options: method 6 is several times slower than 4 for a
+        # few % smaller files, so it is left to the user
+        if output_format == 'WebP':
+            save_kwargs['method'] = settings.webp_method
+            save_kwargs['lossless'] = settings.webp_lossless
+        
+        # PNG specific options: the zlib level is explicit (optimize=True would
+        # force level 9, which costs about twice the time for a tiny gain)
+        if output_format == 'PNG':
+            save_kwargs.pop('optimize', None)
+            save_kwargs['compress_level'] = settings.png_compress_level
+        
+        return cls(
+            settings=settings,
+            base_dir=base_dir,
+            rename_pattern=_prepare_rename_pattern(settings.rename_pattern, now),
+            pil_format=OUTPUT_FMT_UPPER[output_format],
+            save_kwargs=save_kwargs,
+            resize_mode=_resize_mode(settings)
+        )
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONVERSION FUNCTIONS
+# ═══════════════════════════════════════════════════════════════════════════════
+# Module-level so they can be pickled and run inside a ProcessPoolExecutor.
+
+def _iter_images(root: str, extensions: frozenset, recursive: bool = True) -> Iterator[os.DirEntry]:
+    """Walk a directory once with os.scandir, yielding entries whose extension is in the set.
+    
+    Extensions are lowercase without the dot. Directory symlinks are not followed.
+    """
+    pending = [root]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                # An entry that vanishes or can't be read mid-walk is skipped on
+                # its own, without dropping the rest of its directory
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            pending.append(entry.path)
+                        continue
+                    _, dot, ext = entry.name.rpartition('.')
+                    if not (dot and ext.lower() in extensions and entry.is_file()):
+                        continue
+                except OSError:
+                    continue
+                yield entry
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(parallel=True, cache=True, fastmath=True)
+    def _resample_rows(src, index, weights):
+        """Resample axis 0 of an (H, W, C) array with precomputed filter taps."""
+        out_h, taps = index.shape
+        _, width, channels = src.shape
+        dst = np.zeros((out_h, width, channels), np.float32)
+        for y in numba.prange(out_h):
+            # Accumulate whole source rows so the inner loops run over contiguous memory
+            for t in range(taps):
+                weight = weights[y, t]
+                if weight == 0.0:
+                    continue
+                row = index[y, t]
+                for x in range(width):
+                    for c in range(channels):
+                        dst[y, x, c] += weight * src[row, x, c]
+        return dst
+    
+    @numba.njit(parallel=True, cache=True, fastmath=True)
+    def _resample_cols(src, index, weights):
+        """Resample axis 1 of an (H, W, C) float32 array into clipped 8-bit pixels."""
+        out_w, taps = index.shape
+        height, _, channels = src.shape
+        dst = np.empty((height, out_w, channels), np.uint8)
+        for y in numba.prange(height):
+            for x in range(out_w):
+                for c in range(channels):
+                    acc = np.float32(0.0)
+                    for t in range(taps):
+                        acc += weights[x, t] * src[y, index[x, t], c]
+                    dst[y, x, c] = min(max(acc + np.float32(0.5), np.float32(0.0)), np.float32(255.0))
+        return dst
+
+
+def _lanczos_table(in_size: int, out_size: int) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Build the [out_size, taps] source index and weight tables for a LANCZOS resample."""
+    scale = in_size / out_size
+    filter_scale = max(scale, 1.0)
+    support = LANCZOS_TAPS * filter_scale
+    taps = int(np.ceil(support)) * 2 + 1
+    
+    centers = (np.arange(out_size) + 0.5) * scale
+    starts = np.maximum(0, (centers - support + 0.5).astype(np.int64))
+    index = starts[:, None] + np.arange(taps)[None, :]
+    x = (index + 0.5 - centers[:, None]) / filter_scale
+    weights = np.sinc(x) * np.sinc(x / LANCZOS_TAPS)
+    weights[(np.abs(x) >= LANCZOS_TAPS) | (index >= in_size)] = 0.0
+    weights /= weights.sum(axis=1, keepdims=True)
+    return np.minimum(index, in_size - 1), weights.astype(np.float32)
+
+
+def _resize_numba(arr: "np.ndarray", out_h: int, out_w: int) -> "np.ndarray":
+    """Separable LANCZOS resize of an 8-bit L/RGB array using all cores."""
+    src = arr.reshape(arr.shape[0], arr.shape[1], -1)
+    rows = _resample_rows(src, *_lanczos_table(src.shape[0], out_h))
+    out = _resample_cols(rows, *_lanczos_table(src.shape[1], out_w))
+    return out.reshape(out_h, out_w) if arr.ndim == 2 else out
+
+
+# Only pool workers (set up by _init_pil) resize with Numba: its threading layer
+# can't be entered from several threads of one process at once, and the
+# in-process thread pool would start one Numba thread per core for every file
+_numba_resize = False
+
+
+# Perceptual hash: DCT of a PHASH_SIZE² greyscale thumbnail, keeping the
+# PHASH_BITS² lowest frequencies. Images whose hashes differ in at most
+# PHASH_MAX_DISTANCE bits are reported as similar
+PHASH_SIZE = 32
+PHASH_BITS = 8
+PHASH_MAX_DISTANCE = 4
+
+if NUMPY_AVAILABLE:
+    # Low-frequency rows of the DCT-II matrix: D @ block @ D.T is the corner
+    # of the 2-D DCT that pHash uses, without computing the rest
+    _k = np.arange(PHASH_SIZE)
+    _DCT_LOW = np.cos(np.pi * (2 * _k[None, :] + 1) * _k[:PHASH_BITS, None]
+                      / (2 * PHASH_SIZE)).astype(np.float32)
+    # Set bits per byte value, for popcounts on NumPy < 2.0
+    _POPCOUNT8 = np.array([bin(i).count('1') for i in range(256)], np.uint8)
+    del _k
+
+# One reusable read buffer per hashing thread
+_hash_buffers = threading.local()
+
+
+def _quick_hash(path: str, size: int) -> bytes:
+    """Hash the first and last QUICK_HASH_BYTES of a file (the whole file when smaller)."""
+    digest = hashlib.blake2b(digest_size=8)
+    # Unbuffered: each read is a single syscall straight into the result
+    with open(path, 'rb', buffering=0) as f:
+        if size <= 2 * QUICK_HASH_BYTES:
+            digest.update(f.read())
+        else:
+            digest.update(f.read(QUICK_HASH_BYTES))
+            f.seek(-QUICK_HASH_BYTES, os.SEEK_END)
+            digest.update(f.read(QUICK_HASH_BYTES))
+    return digest.digest()
+
+
+def _full_hash(path: str) -> bytes:
+    """Hash a whole file in HASH_CHUNK_SIZE reads."""
+    digest = hashlib.blake2b(digest_size=16)
+    view = getattr(_hash_buffers, 'view', None)
+    if view is None:
+        view = _hash_buffers.view = memoryview(bytearray(HASH_CHUNK_SIZE))
+    
+    # readinto() refills the thread's buffer instead of allocating a bytes per
+    # chunk, and buffering=0 skips the extra copy through a BufferedReader
+    with open(path, 'rb', buffering=0) as f:
+        while (n := f.readinto(view)):
+            digest.update(view[:n])
+    return digest.digest()
+
+
+def _phash(path: str) -> int:
+    """64-bit DCT perceptual hash of an image; similar images get close hashes."""
+    with Image.open(path) as img:
+        # JPEGs can be decoded at a fraction of their size for a thumbnail this small
+        img.draft('L', (PHASH_SIZE * 4, PHASH_SIZE * 4))
+        small = img.convert('L').resize((PHASH_SIZE, PHASH_SIZE), Image.Resampling.BILINEAR)
+    low = _DCT_LOW @ np.asarray(small, dtype=np.float32) @ _DCT_LOW.T
+    bits = np.packbits(low.ravel() > np.median(low))
+    return int.from_bytes(bits.tobytes(), 'big')
+
+
+def _phash_worker(path: str) -> Tuple[Optional[int], str]:
+    """Process pool task: (pHash, path), with None for files Pillow cannot read."""
+    try:
+        return _phash(path), path
+    except Exception:
+        return None, path
+
+
+def _popcount64(values: "np.ndarray") -> "np.ndarray":
+    """Number of set bits in each element of a uint64 array."""
+    if hasattr(np, 'bitwise_count'):  # NumPy 2.0+
+        return np.bitwise_count(values)
+    return _POPCOUNT8[values.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+
+def _find_similar_groups(paths: Iterable[str], workers: int = 1,
+                         progress: Optional[Callable[[int, int], None]] = None,
+                         max_distance: int = PHASH_MAX_DISTANCE,
+                         process_pool: Optional[ProcessPoolExecutor] = None) -> List[List[str]]:
+    """Group images whose perceptual hashes are within max_distance bits.
+    
+    Files Pillow cannot read are skipped. progress works as in _find_duplicate_groups.
+    Hashing runs in process_pool if given, otherwise in a pool started for this call.
+    """
+    paths = list(paths)
+    by_hash: Dict[int, List[str]] = {}
+    
+    # Decoding and the DCT are CPU-bound Python/NumPy work, so they need
+    # processes rather than threads to use more than one core. Chunks of 32
+    # keep the per-task pickling overhead small next to a decode
+    executor = process_pool if process_pool is not None else _create_process_pool(workers)
+    with (executor if executor is not process_pool else nullcontext()):
+        results = executor.map(_phash_worker, paths, chunksize=32)
+        for hashed, (value, path) in enumerate(results, 1):
+            if value is not None:
+                by_hash.setdefault(value, []).append(path)
+            if progress is not None:
+                progress(hashed, len(paths))
+    
+    # Identical hashes are grouped already; near ones are joined with a
+    # union-find, comparing each hash against all later ones in one XOR
+    hashes = np.array(list(by_hash), dtype=np.uint64)
+    parent = list(range(len(hashes)))
+    
+    def root(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    
+    for i in range(len(hashes) - 1):
+        close = np.flatnonzero(_popcount64(hashes[i + 1:] ^ hashes[i]) <= max_distance)
+        for j in close + i + 1:
+            parent[root(int(j))] = root(i)
+    
+    clusters: Dict[int, List[str]] = {}
+    for i, group in enumerate(by_hash.values()):
+        clusters.setdefault(root(i), []).extend(group)
+    return [group for group in clusters.values() if len(group) > 1]
+
+
+def _directory_signature(directory: str) -> Tuple[int, ...]:
+    """Modification times of a directory tree's folders, in walk order.
+    
+    Adding, removing or renaming files anywhere in the tree changes it; editing
+    a file in place does not. Only directories are stat'ed, never files.
+    """
+    signature = [os.stat(directory).st_mtime_ns]
+    pending = [directory]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            subdirs = sorted((entry for entry in entries if entry.is_dir(follow_symlinks=False)),
+                             key=lambda entry: entry.name)
+        for entry in subdirs:
+            signature.append(entry.stat(follow_symlinks=False).st_mtime_ns)
+            pending.append(entry.path)
+    return tuple(signature)
+
+
+def _find_duplicate_groups(files: Iterable[Tuple[str, int]], workers: int = 1,
+                           progress: Optional[Callable[[int, int], None]] = None) -> List[List[str]]:
+    """Group (path, size) pairs whose files have identical content.
+    
+    progress, if given, is called with (files hashed, files to hash) as hashing
+    goes on, possibly from the hashing threads.
+    """
+    by_size: Dict[int, List[str]] = {}
+    quick: List[Tuple[str, int, Future]] = []
+    total = 0
+    hashed = count(1)
+    
+    def hashed_one(_future):
+        # next() on a count is atomic, so the hashing threads can share it
+        if progress is not None:
+            progress(next(hashed), total)
+    
+    # Hashing mostly waits on the disk, and both the reads and blake2b release
+    # the GIL, so threads overlap the I/O of several files
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        
+        def submit(hash_file, *args) -> Future:
+            nonlocal total
+            total += 1
+            future = executor.submit(hash_file, *args)
+            future.add_done_callback(hashed_one)
+            return future
+        
+        # A file with a size nobody else has cannot have a duplicate, so most
+        # files are never opened. Files start hashing (head and tail only) as
+        # soon as their size turns up twice, while the walk goes on
+        for path, size in files:
+            paths = by_size.setdefault(size, [])
+            paths.append(path)
+            if len(paths) == 2:
+                quick.append((paths[0], size, submit(_quick_hash, paths[0], size)))
+            if len(paths) >= 2:
+                quick.append((path, size, submit(_quick_hash, path, size)))
+        
+        by_quick: Dict[Tuple[int, bytes], List[str]] = {}
+        for path, size, future in quick:
+            by_quick.setdefault((size, future.result()), []).append(path)
+        
+        # Only files that still collide are read in full
+        groups = []
+        full: List[Tuple[str, int, Future]] = []
+        for (size, _), group in by_quick.items():
+            if len(group) < 2:
+                continue
+            if size <= 2 * QUICK_HASH_BYTES:
+                # The quick hash already covered the whole file
+                groups.append(group)
+            else:
+                full.extend((path, size, submit(_full_hash, path)) for path in group)
+        
+        by_full: Dict[Tuple[int, bytes], List[str]] = {}
+        for path, size, future in full:
+            by_full.setdefault((size, future.result()), []).append(path)
+        groups.extend(group for group in by_full.values() if len(group) > 1)
+    
+    return groups
+
+
+def _link_or_copy(source: str, target: str):
+    """Hard-link target to source, copying instead where links are not possible.
+    
+    The link is made under a temporary name and moved over target, so an
+    existing target is only replaced once the new file is complete.
+    """
+    temp = f"{target}.{os.getpid()}.part"
+    try:
+        try:
+            os.link(source, temp)
+        except OSError:
+            shutil.copyfile(source, temp)
+        os.replace(temp, target)
+    except OSError:
+        if os.path.lexists(temp):
+            os.remove(temp)
+        raise
+
+
+def _init_pil(numba_threads: int = 0):
+    """Process pool initializer: import Pillow and load its format plugins once."""
+    global _numba_resize
+    Image.init()
+    
+    # Compile the resize kernel now rather than on the first large image, and share
+    # the cores between workers instead of every process starting one thread per core
+    if NUMBA_AVAILABLE:
+        if numba_threads:
+            numba.set_num_threads(min(numba_threads, numba.config.NUMBA_NUM_THREADS))
+        _resize_numba(np.asarray(Image.new('RGB', (8, 8))), 4, 4)
+        _numba_resize = True
+
+
+def _process_pool_size(settings: ConversionSettings) -> int:
+    """Number of workers a batch keeps busy at once, capped by free RAM in Auto mode."""
+    workers = settings.max_workers
+    if settings.auto_workers and PSUTIL_AVAILABLE:
+        fit = psutil.virtual_memory().available // (4 * ESTIMATED_IMAGE_BYTES)
+        workers = max(1, min(workers, fit))
+    return workers
+
+
+def _create_process_pool(workers: int) -> ProcessPoolExecutor:
+    """Start a spawn-based pool whose workers have Pillow (and Numba) warmed up."""
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_pil,
+        initargs=(max(1, AVAILABLE_CPUS // workers),)
+    )
+
+
+def _prepare_rename_pattern(pattern: str, now: datetime) -> str:
+    """Fill in the batch-wide {date} and {time} tokens once, leaving only {name} per file."""
+    return pattern.replace('{date}', now.strftime('%Y%m%d')).replace('{time}', now.strftime('%H%M%S'))
+
+
+def _generate_output_path(source: str, plan: ConversionPlan) -> str:
+    """Generate output path for converted image.
+    
+    Works on plain strings with os.path; this runs once per file, and pathlib
+    would build several intermediate Path objects each time.
+    """
+    settings = plan.settings
+    output_ext = OUTPUT_FORMATS[settings.output_format]['ext']
+    source_dir, filename = os.path.split(source)
+    
+    # Determine base name
+    stem = os.path.splitext(filename)[0]
+    
+    # Apply rename pattern if set ({date}/{time} are already filled in for the batch)
+    if plan.rename_pattern:
+        stem = plan.rename_pattern.replace('{name}', stem)
+    
+    # Add suffix if set
+    if settings.add_suffix:
+        stem = f"{stem}{settings.add_suffix}"
+    
+    # Determine output directory
+    if settings.output_directory:
+        # Preserve relative path structure
+        relative = os.path.relpath(source_dir, plan.base_dir)
+        output_dir = (settings.output_directory if relative == os.curdir
+                      else os.path.join(settings.output_directory, relative))
+        os.makedirs(output_dir, exist_ok=True)
+    else:
+        output_dir = source_dir
+    
+    return os.path.join(output_dir, f"{stem}{output_ext}")
+
+
+def _flatten_alpha(img: "Image.Image") -> "Image.Image":
+    """Composite an RGBA image onto a white background and return it as RGB."""
+    # alpha_composite works on the whole buffer at once, without splitting the bands
+    background = Image.new('RGBA', img.size, (255, 255, 255, 255))
+    background.alpha_composite(img)
+    return background.convert('RGB')
+
+
+def _convert_image(source: str, plan: ConversionPlan,
+                   original_size: Optional[int] = None) -> ConversionResult:
+    """Convert a single image. Pass original_size when the scan already has it."""
+    settings = plan.settings
+    if original_size is None:
+        original_size = os.stat(source).st_size
+    output_path = _generate_output_path(source, plan)
+    
+    try:
+        with Image.open(source) as opened:
+            img = opened
+            
+            # Target size is computed up front so JPEGs can be decoded straight
+            # at 1/2, 1/4 or 1/8 scale by libjpeg (draft only works before loading)
+            new_size = None
+            if settings.resize_enabled:
+                new_size = _calculate_resize(img.size, plan)
+                if img.format == 'JPEG' and new_size[0] < img.width and new_size[1] < img.height:
+                    img.draft(img.mode, new_size)
+            
+            # Palette images are expanded before resizing, since Pillow resizes
+            # them with NEAREST. Only palettes with a transparent entry need
+            # the RGBA round trip
+            output_format = settings.output_format
+            if img.mode == 'P' and output_format in ['JPEG']:
+                if 'transparency' in img.info:
+                    img = _flatten_alpha(img.convert('RGBA'))
+                else:
+                    img = img.convert('RGB')
+            
+            # Resize if enabled
+            if new_size is not None and new_size != img.size:
+                if (_numba_resize and img.mode in ('L', 'RGB')
+                        and img.width * img.height >= NUMBA_RESIZE_MIN_PIXELS):
+                    # Pillow resizes on a single core; the Numba kernel uses all of them
+                    img = Image.fromarray(_resize_numba(np.asarray(img), new_size[1], new_size[0]),
+                                          img.mode)
+                elif (plan.resize_mode != RESIZE_EXACT
+                        and new_size[0] <= img.width and new_size[1] <= img.height):
+                    # Downscale only: thumbnail() resizes in place, reducing first
+                    img.thumbnail(new_size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+                else:
+                    img = img.resize(new_size, Image.Resampling.LANCZOS)
+            
+            # Convert RGBA to RGB for formats that don't support transparency; done
+            # after resizing so the white background is allocated at the final size
+            if img.mode == 'RGBA' and output_format in ['JPEG', 'BMP']:
+                img = _flatten_alpha(img)
+            
+            # Images with at most 256 colors lose nothing as palette PNGs, which
+            # encode faster and come out smaller. Pillow can only quantize RGBA
+            # approximately, so only opaque images qualify
+            if output_format == 'PNG' and settings.png_palette:
+                if img.mode == 'RGBA' and img.getextrema()[3] == (255, 255):
+                    img = img.convert('RGB')
+                if img.mode == 'RGB' and img.getcolors(maxcolors=256) is not None:
+                    img = img.quantize(colors=256, method=Image.Quantize.MEDIANCUT)
+            
+            # Release the decoded source as soon as a converted copy replaces it,
+            # so a worker holds at most one full-size image while encoding
+            if img is not opened:
+                opened.close()
+            
+            # Encode in memory so the new size is known without a stat on the output
+            buffer = io.BytesIO()
+            img.save(buffer, plan.pil_format, **plan.save_kwargs)
+            img.close()
+            del img
+        
+        new_size = buffer.tell()
+        with open(output_path, 'wb') as output_file:
+            output_file.write(buffer.getbuffer())
+        buffer.close()
+        
+        # Delete original if requested
+        if settings.delete_original and source != output_path:
+            os.remove(source)
+        
+        # Paths are only wrapped for the UI, once the file is done
+        return ConversionResult(
+            source_path=Path(source),
+            output_path=Path(output_path),
+            success=True,
+            original_size=original_size,
+            new_size=new_size
+        )
+        
+    except Exception as e:
+        return ConversionResult(
+            source_path=Path(source),
+            output_path=None,
+            success=False,
+            original_size=original_size,
+            new_size=0,
+            error_message=str(e)
+        )
+
+
+def _convert_single(source_path: str, plan: ConversionPlan, original_size: int) -> ConversionResult:
+    """Process pool entry point: convert one image from picklable arguments."""
+    return _convert_image(source_path, plan, original_size)
+
+
+def _fit_both(width: int, height: int, target_w: int, target_h: int) -> Tuple[int, int]:
+    """Largest size within the target box keeping the aspect ratio."""
+    # Cross-multiplied form of target_w / width <= target_h / height
+    if target_w * height <= target_h * width:
+        return (target_w, height * target_w // width)
+    return (width * target_h // height, target_h)
+
+
+# Indexed by resize mode; integer math avoids float ratios (and their rounding)
+_RESIZERS = (
+    lambda width, height, target_w, target_h: (target_w or width, target_h or height),
+    lambda width, height, target_w, target_h: (target_w, height * target_w // width),
+    lambda width, height, target_w, target_h: (width * target_h // height, target_h),
+    _fit_both,
+)
+
+
+def _calculate_resize(original_size: Tuple[int, int], plan: ConversionPlan) -> Tuple[int, int]:
+    """Calculate new size maintaining aspect ratio if needed."""
+    settings = plan.settings
+    return _RESIZERS[plan.resize_mode](original_size[0], original_size[1],
+                                        settings.resize_width, settings.resize_height)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -461,206 +1163,407 @@ class ConversionWorker(QThread):
     
     progress = pyqtSignal(int, int)  # current, total
     log_message = pyqtSignal(str, str)  # message, type (info/success/error/warning)
+    log_batch = pyqtSignal(list)  # list of (message, type)
     conversion_complete = pyqtSignal(list)  # list of ConversionResult
     file_converted = pyqtSignal(object)  # ConversionResult
     
-    def __init__(self, directory: str, settings: ConversionSettings):
+    def __init__(self, directory: str, settings: ConversionSettings,
+                 process_pool: Optional[ProcessPoolExecutor] = None):
         super().__init__()
         self.directory = Path(directory)
+        self._directory_str = str(self.directory)
         self.settings = settings
+        # A pool owned by the caller outlives this run; without one, a pool
+        # is started (and shut down) for this run only
+        self.process_pool = process_pool
         self._is_cancelled = False
+        self._log_buf: List[Tuple[str, str]] = []
+        self._last_flush = time.monotonic()
+        self._plan = ConversionPlan.from_settings(settings, self._directory_str, datetime.now())
     
     def cancel(self):
         """Cancel the conversion process."""
         self._is_cancelled = True
     
-    def get_input_extensions(self) -> List[str]:
-        """Get list of input file extensions based on settings."""
-        return INPUT_FORMATS.get(self.settings.input_format, INPUT_FORMATS['All Images'])
+    def get_input_extensions(self) -> frozenset:
+        """Get the set of input file extensions (lowercase, no dot) based on settings."""
+        return INPUT_EXT_SETS.get(self.settings.input_format, INPUT_EXT_SETS['All Images'])
     
-    def find_images(self) -> List[Path]:
-        """Find all images in directory matching input format."""
-        extensions = self.get_input_extensions()
-        images = []
-        
-        if self.settings.recursive:
-            for ext in extensions:
-                images.extend(self.directory.rglob(f'*{ext}'))
-                images.extend(self.directory.rglob(f'*{ext.upper()}'))
-        else:
-            for ext in extensions:
-                images.extend(self.directory.glob(f'*{ext}'))
-                images.extend(self.directory.glob(f'*{ext.upper()}'))
-        
-        # Remove duplicates and sort
-        images = list(set(images))
-        images.sort()
-        return images
+    def iter_images(self) -> Iterator[Tuple[str, int]]:
+        """Yield (path, size) of images matching input format as the walk finds them."""
+        ext_set = self.get_input_extensions()
+        
+        # A single walk yields each file once, so no dedup is needed; the size
+        # comes from the DirEntry, sparing the converter another stat()
+        for entry in _iter_images(self._directory_str, ext_set, self.settings.recursive):
+            yield entry.path, entry.stat().st_size
     
-    def generate_output_path(self, source: Path) -> Path:
+    def generate_output_path(self, source: str) -> str:
         """Generate output path for converted image."""
-        output_ext = OUTPUT_FORMATS[self.settings.output_format]['ext']
-        
-        # Determine base name
-        stem = source.stem
-        
-        # Apply rename pattern if set
-        if self.settings.rename_pattern:
-            pattern = self.settings.rename_pattern
-            pattern = pattern.replace('{name}', stem)
-            pattern = pattern.replace('{date}', datetime.now().strftime('%Y%m%d'))
-            pattern = pattern.replace('{time}', datetime.now().strftime('%H%M%S'))
-            stem = pattern
-        
-        # Add suffix if set
-        if self.settings.add_suffix:
-            stem = f"{stem}{self.settings.add_suffix}"
-        
-        # Determine output directory
-        if self.settings.output_directory:
-            output_dir = Path(self.settings.output_directory)
-            # Preserve relative path structure
-            relative = source.parent.relative_to(self.directory)
-            output_dir = output_dir / relative
-            output_dir.mkdir(parents=True, exist_ok=True)
-        else:
-            output_dir = source.parent
-        
-        return output_dir / f"{stem}{output_ext}"
+        return _generate_output_path(str(source), self._plan)
     
-    def convert_single_image(self, source: Path) -> ConversionResult:
+    def convert_single_image(self, source: str, original_size: Optional[int] = None) -> ConversionResult:
         """Convert a single image."""
-        original_size = source.stat().st_size
-        output_path = self.generate_output_path(source)
+        return _convert_image(str(source), self._plan, original_size)
+    
+    def calculate_resize(self, original_size: Tuple[int, int]) -> Tuple[int, int]:
+        """Calculate new size maintaining aspect ratio if needed."""
+        return _calculate_resize(original_size, self._plan)
+    
+    def _find_duplicate(self, source: str, size: int) -> Optional[str]:
+        """Return an earlier file of this batch with identical content, if any."""
+        # Files are only read once a second file of their size turns up; the
+        # first one of each size is hashed then, as the candidate leader
+        first = self._dup_sizes.setdefault(size, source)
+        if first == source:
+            return None
+        if first is not None:
+            self._dup_sizes[size] = None
+            try:
+                self._dup_leaders.setdefault((size, _quick_hash(first, size)), first)
+            except OSError:
+                # Already moved away by the converter (delete original)
+                pass
         
         try:
-            with Image.open(source) as img:
-                # Convert RGBA to RGB for formats that don't support transparency
-                output_format = self.settings.output_format
-                if img.mode == 'RGBA' and output_format in ['JPEG', 'BMP']:
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    background.paste(img, mask=img.split()[3])
-                    img = background
-                elif img.mode == 'P' and output_format in ['JPEG']:
-                    img = img.convert('RGB')
-                
-                # Resize if enabled
-                if self.settings.resize_enabled:
-                    new_size = self.calculate_resize(img.size)
-                    if new_size != img.size:
-                        img = img.resize(new_size, Image.Resampling.LANCZOS)
-                
-                # Prepare save arguments
-                save_kwargs = {}
-                format_config = OUTPUT_FORMATS[output_format]
-                
-                if format_config['quality'] and output_format != 'PNG':
-                    save_kwargs['quality'] = self.settings.quality
-                
-                if format_config['optimize'] and self.settings.apply_optimization:
-                    save_kwargs['optimize'] = True
-                
-                # WebP specific options
-                if output_format == 'WebP':
-                    save_kwargs['method'] = 6  # Best compression
-                
-                # PNG specific options
-                if output_format == 'PNG':
-                    save_kwargs['compress_level'] = 9
-                
-                # Save the image
-                img.save(output_path, format_config['ext'][1:].upper(), **save_kwargs)
-            
-            new_size = output_path.stat().st_size
+            key = (size, _quick_hash(source, size))
+            leader = self._dup_leaders.setdefault(key, source)
+            if leader == source:
+                return None
             
-            # Delete original if requested
+            # Heads and tails match; compare the whole files before trusting it
+            if size > 2 * QUICK_HASH_BYTES:
+                if leader not in self._dup_full_hashes:
+                    self._dup_full_hashes[leader] = _full_hash(leader)
+                if _full_hash(source) != self._dup_full_hashes[leader]:
+                    return None
+            return leader
+        except OSError:
+            # Unreadable (or already deleted) files are left to the converter
+            return None
+    
+    def _reuse_output(self, leader: ConversionResult, source: str, size: int) -> ConversionResult:
+        """Give a duplicate input the output already encoded for its identical leader."""
+        name = os.path.basename(source)
+        if not leader.success:
+            self._log(f"❌ {name}: {leader.error_message}", "error")
+            return ConversionResult(Path(source), None, False, size, 0, leader.error_message)
+        
+        try:
+            output_path = self.generate_output_path(source)
+            # Inputs differing only in extension (a.jpg, a.jpeg) share the
+            # leader's output, which already holds the right content
+            if Path(output_path) != leader.output_path:
+                _link_or_copy(str(leader.output_path), output_path)
             if self.settings.delete_original and source != output_path:
-                source.unlink()
-            
-            return ConversionResult(
-                source_path=source,
-                output_path=output_path,
-                success=True,
-                original_size=original_size,
-                new_size=new_size
-            )
-            
-        except Exception as e:
-            return ConversionResult(
-                source_path=source,
-                output_path=None,
-                success=False,
-                original_size=original_size,
-                new_size=0,
-                error_message=str(e)
-            )
+                os.remove(source)
+        except OSError as e:
+            self._log(f"❌ {name}: {e}", "error")
+            return ConversionResult(Path(source), None, False, size, 0, str(e))
+        
+        self._log(
+            f"♻️ {name} → {os.path.basename(output_path)} "
+            f"(skipped duplicate of {leader.source_path.name})",
+            "info"
+        )
+        return ConversionResult(Path(source), Path(output_path), True, size, leader.new_size)
     
-    def calculate_resize(self, original_size: Tuple[int, int]) -> Tuple[int, int]:
-        """Calculate new size maintaining aspect ratio if needed."""
-        width, height = original_size
-        new_width = self.settings.resize_width or width
-        new_height = self.settings.resize_height or height
-        
-        if self.settings.maintain_aspect_ratio:
-            if self.settings.resize_width and not self.settings.resize_height:
-                ratio = new_width / width
-                new_height = int(height * ratio)
-            elif self.settings.resize_height and not self.settings.resize_width:
-                ratio = new_height / height
-                new_width = int(width * ratio)
-            elif self.settings.resize_width and self.settings.resize_height:
-                ratio = min(new_width / width, new_height / height)
-                new_width = int(width * ratio)
-                new_height = int(height * ratio)
-        
-        return (new_width, new_height)
+    def _log(self, message: str, msg_type: str):
+        """Queue a log line, sending the batch to the UI when it is full or old enough."""
+        self._log_buf.append((message, msg_type))
+        if (len(self._log_buf) >= LOG_BATCH_SIZE
+                or time.monotonic() - self._last_flush >= LOG_FLUSH_INTERVAL):
+            self._flush_log()
+    
+    def _flush_log(self):
+        """Send the queued log lines to the UI as a single signal."""
+        if self._log_buf:
+            self.log_batch.emit(self._log_buf)
+            self._log_buf = []
+        self._last_flush = time.monotonic()
     
     def run(self):
         """Execute the conversion process."""
         results = []
         
+        # Save arguments are resolved once for the batch, with one timestamp so
+        # {date}/{time} match across files
+        self._plan = ConversionPlan.from_settings(self.settings, self._directory_str, datetime.now())
+        
+        # Duplicate tracking: size -> first source not yet hashed (None once
+        # it is), quick key -> first source, cached full hashes, finished
+        # leaders' results and duplicates (with sizes) still waiting on a leader
+        self._dup_sizes: Dict[int, Optional[str]] = {}
+        self._dup_leaders: Dict[Tuple[int, bytes], str] = {}
+        self._dup_full_hashes: Dict[str, bytes] = {}
+        leader_results: Dict[str, ConversionResult] = {}
+        waiting: Dict[str, List[Tuple[str, int]]] = {}
+        
+        def add_duplicate(leader: ConversionResult, source: str, size: int):
+            """Record a duplicate handled without its own conversion."""
+            nonlocal done
+            result = self._reuse_output(leader, source, size)
+            results.append(result)
+            done += 1
+            self.file_converted.emit(result)
+            self.progress.emit(done, found)
+        
         self.log_message.emit(f"🔍 Scanning directory: {self.directory}", "info")
-        images = self.find_images()
+        images = self.iter_images()
         
-        if not images:
+        # Peek at the first few files: enough to choose the executor without
+        # waiting for the whole tree to be scanned
+        head = list(islice(images, PROCESS_POOL_THRESHOLD))
+        if not head:
             self.log_message.emit("⚠️ No images found matching the selected format.", "warning")
             self.conversion_complete.emit(results)
             return
         
-        total = len(images)
-        self.log_message.emit(f"📁 Found {total} images to convert", "info")
         self.log_message.emit(f"🎯 Output format: {self.settings.output_format} | Quality: {self.settings.quality}%", "info")
         self.log_message.emit("─" * 60, "info")
         
-        with ThreadPoolExecutor(max_workers=self.settings.max_workers) as executor:
-            futures = {executor.submit(self.convert_single_image, img): img for img in images}
+        # Pillow's codecs hold the GIL for part of the work, so real batches run in
+        # separate processes; tiny ones stay on threads to skip the spawn overhead
+        workers = self.settings.max_workers
+        if len(head) < PROCESS_POOL_THRESHOLD:
+            executor = ThreadPoolExecutor(max_workers=workers)
             
-            for i, future in enumerate(as_completed(futures)):
-                if self._is_cancelled:
-                    self.log_message.emit("🛑 Conversion cancelled by user", "warning")
-                    break
+            def submit(img, size):
+                return executor.submit(self.convert_single_image, img, size)
+        else:
+            if self.process_pool is not None:
+                # Reuse the caller's pool, warm from any earlier run
+                executor = self.process_pool
+            else:
+                executor = _create_process_pool(workers)
+            
+            def submit(img, size):
+                return executor.submit(_convert_single, img, self._plan, size)
+        
+        # Feed the executor while the walk goes on, keeping at most two tasks per
+        # worker in flight so memory stays flat even on huge trees; the free-RAM
+        # cap narrows this window rather than resizing the pool
+        window = 2 * _process_pool_size(self.settings)
+        images = chain(head, images)
+        pending = set()
+        found = done = 0
+        scanning = True
+        
+        # Only executors started for this run are shut down when it ends
+        with (executor if executor is not self.process_pool else nullcontext()):
+            while not self._is_cancelled:
+                while scanning and len(pending) < window:
+                    image = next(images, None)
+                    if image is None:
+                        scanning = False
+                        self._log(f"📁 Found {found} images to convert", "info")
+                        self.progress.emit(done, found)
+                        continue
+                    
+                    found += 1
+                    leader = (self._find_duplicate(*image)
+                              if self.settings.skip_duplicates else None)
+                    if leader is None:
+                        pending.add(submit(*image))
+                    elif leader in leader_results:
+                        add_duplicate(leader_results[leader], *image)
+                    else:
+                        waiting.setdefault(leader, []).append(image)
                 
-                result = future.result()
-                results.append(result)
+                if not pending:
+                    break
                 
-                if result.success:
-                    self.log_message.emit(
-                        f"✅ {result.source_path.name} → {result.output_path.name} "
-                        f"({result.new_size/1024:.1f}KB, -{result.compression_ratio:.1f}%)",
-                        "success"
-                    )
-                else:
-                    self.log_message.emit(
-                        f"❌ {result.source_path.name}: {result.error_message}",
-                        "error"
-                    )
+                finished, pending = wait(pending, timeout=LOG_FLUSH_INTERVAL,
+                                         return_when=FIRST_COMPLETED)
+                if not finished:
+                    # Slow files: don't hold finished lines back until the next one
+                    self._flush_log()
+                    continue
                 
-                self.file_converted.emit(result)
-                self.progress.emit(i + 1, total)
+                for future in finished:
+                    result = future.result()
+                    results.append(result)
+                    
+                    if result.success:
+                        self._log(
+                            f"✅ {result.source_path.name} → {result.output_path.name} "
+                            f"({result.new_size/1024:.1f}KB, -{result.compression_ratio:.1f}%)",
+                            "success"
+                        )
+                    else:
+                        self._log(
+                            f"❌ {result.source_path.name}: {result.error_message}",
+                            "error"
+                        )
+                    
+                    done += 1
+                    self.file_converted.emit(result)
+                    
+                    # The total only grows as the walk finds more files
+                    self.progress.emit(done, found)
+                    
+                    # Duplicates of this file reuse its output instead of re-encoding
+                    source = str(result.source_path)
+                    if self.settings.skip_duplicates:
+                        leader_results[source] = result
+                        for duplicate in waiting.pop(source, ()):
+                            add_duplicate(result, *duplicate)
+            
+            if self._is_cancelled:
+                self._log("🛑 Conversion cancelled by user", "warning")
+                for future in pending:
+                    future.cancel()
         
+        self._flush_log()
         self.conversion_complete.emit(results)
 
 
+class DuplicateFinderWorker(QThread):
+    """Worker thread for the duplicate finder."""
+    
+    progress = pyqtSignal(int, int)  # files hashed, files to hash
+    # list of groups of paths, and the scan's cache key (None if it can't be cached)
+    duplicates_found = pyqtSignal(list, object)
+    error = pyqtSignal(str)
+    
+    def __init__(self, directory: str, workers: int, similar: bool = False,
+                 process_pool: Optional[ProcessPoolExecutor] = None,
+                 cache: Optional[Tuple[tuple, List[List[str]]]] = None):
+        super().__init__()
+        self.directory = directory
+        self.workers = workers
+        # Group visually similar images (perceptual hash) instead of identical
+        # files; those are hashed in the (shared, if given) process pool
+        self.similar = similar
+        self.process_pool = process_pool
+        # Previous scan as (key, groups), reused if the tree hasn't changed
+        self.cache = cache
+        self._last_progress = 0.0
+    
+    def _report_progress(self, hashed: int, total: int):
+        """Forward hashing progress to the UI at most every LOG_FLUSH_INTERVAL seconds."""
+        now = time.monotonic()
+        if now - self._last_progress >= LOG_FLUSH_INTERVAL:
+            self._last_progress = now
+            self.progress.emit(hashed, total)
+    
+    def run(self):
+        """Walk the directory and group files with identical content."""
+        try:
+            # Nothing was added, removed or renamed since the last scan of this
+            # tree: send back the previous result without opening any file
+            try:
+                signature = _directory_signature(self.directory)
+            except OSError:
+                signature = ()
+            key = (self.directory, self.similar, signature) if signature else None
+            if key is not None and self.cache is not None and self.cache[0] == key:
+                self.duplicates_found.emit(self.cache[1], key)
+                return
+            
+            if self.similar:
+                paths = (entry.path for entry in _iter_images(self.directory, IMAGE_EXTS))
+                self.duplicates_found.emit(_find_similar_groups(
+                    paths, self.workers, self._report_progress, process_pool=self.process_pool
+                ), key)
+                return
+            
+            # The scandir walk filters on the name before any stat, and the
+            # DirEntry caches the size for the bucketing
+            files = ((entry.path, entry.stat().st_size)
+                     for entry in _iter_images(self.directory, IMAGE_EXTS))
+            groups = _find_duplicate_groups(files, self.workers, self._report_progress)
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+        self.duplicates_found.emit(groups, key)
+
+
+class RenameWorker(QThread):
+    """Worker thread for batch renaming."""
+    
+    rename_complete = pyqtSignal(int)  # files renamed
+    error = pyqtSignal(str)
+    
+    def __init__(self, directory: str, pattern: str):
+        super().__init__()
+        self.directory = directory
+        self.pattern = pattern
+    
+    def run(self):
+        """Rename the images in the directory following the pattern."""
+        try:
+            # DirEntry names are used as they are; no Path is built per file
+            entries = sorted(_iter_images(self.directory, IMAGE_EXTS, recursive=False),
+                             key=lambda entry: entry.name)
+            
+            # {date} and {time} are the same for the whole batch, so only
+            # {name} and {counter} are left to fill in per file
+            template = _prepare_rename_pattern(self.pattern, datetime.now())
+            
+            for counter, entry in enumerate(entries, 1):
+                stem, ext = os.path.splitext(entry.name)
+                new_name = template.replace('{name}', stem).replace('{counter}', f"{counter:04d}")
+                os.rename(entry.path, os.path.join(self.directory, new_name + ext))
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+        self.rename_complete.emit(len(entries))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TABLE MODELS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TableModel(QAbstractTableModel):
+    """Read-only table of string rows for a QTableView.
+    
+    Rows are plain tuples, so views only create cell data for the rows on screen.
+    """
+    
+    def __init__(self, headers: List[str], parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._rows: List[Tuple[str, ...]] = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Number of rows."""
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Number of columns."""
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Text of a cell."""
+        if role == Qt.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Column titles."""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
+    
+    def append_row(self, row: Tuple[str, ...]):
+        """Add one row at the end."""
+        position = len(self._rows)
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.append(row)
+        self.endInsertRows()
+    
+    def set_rows(self, rows: List[Tuple[str, ...]]):
+        """Replace all rows at once."""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+    
+    def clear(self):
+        """Remove all rows."""
+        self.set_rows([])
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # MAIN APPLICATION WINDOW
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -672,6 +1575,25 @@ class ImageConverterPro(QMainWindow):
         super().__init__()
         self.settings = ConversionSettings()
         self.worker = None
+        self.rename_worker = None
+        self.duplicate_worker = None
+        # Last duplicate scan: ((directory, similar, signature), groups)
+        self._dup_cache: Optional[Tuple[tuple, List[List[str]]]] = None
+        # History is recorded even before its tab has been opened
+        self.history_model = TableModel([
+            "Date/Time", "Files", "Format", "Space Saved", "Status"
+        ], self)
+        self._log_buffer: List[str] = []
+        self._log_scheduled = False
+        self._pending_progress: Optional[Tuple[int, int]] = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._apply_progress)
+        # Worker processes are kept between conversions so only the first run
+        # pays for spawning them and importing Pillow
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers = 0
         self.conversion_history = []
         self.init_ui()
     
@@ -679,7 +1601,6 @@ class ImageConverterPro(QMainWindow):
         """Initialize the user interface."""
         self.setWindowTitle(f"{APP_NAME} v{APP_VERSION}")
         self.setMinimumSize(1000, 800)
-        self.setStyleSheet(DARK_THEME)
         
         # Central widget
         central_widget = QWidget()
@@ -695,11 +1616,14 @@ class ImageConverterPro(QMainWindow):
         self.tabs = QTabWidget()
         main_layout.addWidget(self.tabs)
         
-        # Create tabs
+        # Create tabs. Batch Tools and History are only built the first time
+        # they are shown; Settings is eager since conversions read its widgets
+        self._tab_builders: Dict[int, Callable[[], QWidget]] = {}
         self.create_conversion_tab()
-        self.create_batch_operations_tab()
+        self._add_lazy_tab("🛠️ Batch Tools", self.create_batch_operations_tab)
         self.create_settings_tab()
-        self.create_history_tab()
+        self._add_lazy_tab("📜 History", self.create_history_tab)
+        self.tabs.currentChanged.connect(self._build_tab_if_needed)
         
         # Status bar
         self.statusBar = QStatusBar()
@@ -742,6 +1666,19 @@ class ImageConverterPro(QMainWindow):
         
         layout.addWidget(header_frame)
     
+    def _add_lazy_tab(self, title: str, builder: Callable[[], QWidget]):
+        """Add an empty tab whose contents are built by builder on first view."""
+        placeholder = QWidget()
+        layout = QVBoxLayout(placeholder)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._tab_builders[self.tabs.addTab(placeholder, title)] = builder
+    
+    def _build_tab_if_needed(self, index: int):
+        """Build a lazy tab's contents the first time it is selected."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            self.tabs.widget(index).layout().addWidget(builder())
+    
     def create_conversion_tab(self):
         """Create the main conversion tab."""
         tab = QWidget()
@@ -794,6 +1731,30 @@ class ImageConverterPro(QMainWindow):
         self.quality_label.setMinimumWidth(50)
         format_layout.addWidget(self.quality_label, 1, 3)
         
+        # PNG options
+        format_layout.addWidget(QLabel("PNG Compression:"), 2, 0)
+        self.png_level_spin = QSpinBox()
+        self.png_level_spin.setRange(0, 9)
+        self.png_level_spin.setValue(6)
+        self.png_level_spin.setEnabled(False)
+        self.png_level_spin.setToolTip("zlib level: 9 is about twice as slow as 6 for a few % smaller files")
+        format_layout.addWidget(self.png_level_spin, 2, 1)
+        
+        self.png_palette_check = QCheckBox("🎨 Palette PNG for images with ≤256 colors")
+        self.png_palette_check.setEnabled(False)
+        format_layout.addWidget(self.png_palette_check, 2, 2, 1, 2)
+        
+        # WebP options
+        format_layout.addWidget(QLabel("WebP Method:"), 3, 0)
+        self.webp_method_spin = QSpinBox()
+        self.webp_method_spin.setRange(0, 6)
+        self.webp_method_spin.setValue(4)
+        self.webp_method_spin.setToolTip("0 = fastest, 6 = smallest files (several times slower)")
+        format_layout.addWidget(self.webp_method_spin, 3, 1)
+        
+        self.webp_lossless_check = QCheckBox("💎 Lossless WebP")
+        format_layout.addWidget(self.webp_lossless_check, 3, 2, 1, 2)
+        
         layout.addWidget(format_group)
         
         # Options group
@@ -815,6 +1776,11 @@ class ImageConverterPro(QMainWindow):
         self.preserve_metadata_check.setChecked(True)
         options_layout.addWidget(self.preserve_metadata_check, 1, 1)
         
+        self.skip_duplicates_check = QCheckBox("♻️ Convert identical files only once")
+        self.skip_duplicates_check.setChecked(True)
+        self.skip_duplicates_check.setToolTip("Duplicates get a hard link (or copy) of the first file's output")
+        options_layout.addWidget(self.skip_duplicates_check, 2, 0)
+        
         layout.addWidget(options_group)
         
         # Resize options
@@ -897,14 +1863,14 @@ class ImageConverterPro(QMainWindow):
         
         clear_log_btn = QPushButton("🧹 Clear Log")
         clear_log_btn.setObjectName("secondaryBtn")
-        clear_log_btn.clicked.connect(lambda: self.log_area.clear())
+        clear_log_btn.clicked.connect(self.clear_log)
         log_layout.addWidget(clear_log_btn)
         
         layout.addWidget(log_group)
         
         self.tabs.addTab(tab, "🔄 Convert")
     
-    def create_batch_operations_tab(self):
+    def create_batch_operations_tab(self) -> QWidget:
         """Create the batch operations tab."""
         tab = QWidget()
         layout = QVBoxLayout(tab)
@@ -936,10 +1902,10 @@ class ImageConverterPro(QMainWindow):
         )
         rename_layout.addWidget(self.rename_pattern_input, 1, 1, 1, 2)
         
-        rename_btn = QPushButton("✏️ Rename Files")
-        rename_btn.setObjectName("accentBtn")
-        rename_btn.clicked.connect(self.batch_rename)
-        rename_layout.addWidget(rename_btn, 2, 0, 1, 3)
+        self.rename_btn = QPushButton("✏️ Rename Files")
+        self.rename_btn.setObjectName("accentBtn")
+        self.rename_btn.clicked.connect(self.batch_rename)
+        rename_layout.addWidget(self.rename_btn, 2, 0, 1, 3)
         
         layout.addWidget(rename_group)
         
@@ -958,10 +1924,17 @@ class ImageConverterPro(QMainWindow):
         dup_dir_layout.addWidget(dup_browse_btn)
         duplicate_layout.addLayout(dup_dir_layout)
         
-        find_dup_btn = QPushButton("🔍 Find Duplicates")
-        find_dup_btn.setObjectName("accentBtn")
-        find_dup_btn.clicked.connect(self.find_duplicates)
-        duplicate_layout.addWidget(find_dup_btn)
+        self.similar_check = QCheckBox("🖼️ Also match visually similar images (perceptual hash)")
+        self.similar_check.setToolTip("Finds resized or re-encoded copies, not just identical files")
+        if not NUMPY_AVAILABLE:
+            self.similar_check.setEnabled(False)
+            self.similar_check.setToolTip("Requires NumPy: pip install numpy")
+        duplicate_layout.addWidget(self.similar_check)
+        
+        self.find_dup_btn = QPushButton("🔍 Find Duplicates")
+        self.find_dup_btn.setObjectName("accentBtn")
+        self.find_dup_btn.clicked.connect(self.find_duplicates)
+        duplicate_layout.addWidget(self.find_dup_btn)
         
         self.duplicate_list = QListWidget()
         duplicate_layout.addWidget(self.duplicate_list)
@@ -983,16 +1956,16 @@ class ImageConverterPro(QMainWindow):
         info_dir_layout.addWidget(info_browse_btn)
         info_layout.addLayout(info_dir_layout)
         
-        self.info_table = QTableWidget()
-        self.info_table.setColumnCount(2)
-        self.info_table.setHorizontalHeaderLabels(["Property", "Value"])
+        self.info_model = TableModel(["Property", "Value"], self)
+        self.info_table = QTableView()
+        self.info_table.setModel(self.info_model)
         self.info_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         info_layout.addWidget(self.info_table)
         
         layout.addWidget(info_group)
         
         layout.addStretch()
-        self.tabs.addTab(tab, "🛠️ Batch Tools")
+        return tab
     
     def create_settings_tab(self):
         """Create the settings tab."""
@@ -1025,26 +1998,27 @@ class ImageConverterPro(QMainWindow):
         perf_group = QGroupBox("⚡ Performance")
         perf_layout = QGridLayout(perf_group)
         
-        perf_layout.addWidget(QLabel("Max Workers (threads):"), 0, 0)
+        perf_layout.addWidget(QLabel("Max Workers:"), 0, 0)
         self.workers_spin = QSpinBox()
-        self.workers_spin.setRange(1, 16)
-        self.workers_spin.setValue(4)
-        self.workers_spin.setToolTip("Number of parallel conversion threads")
+        self.workers_spin.setRange(1, max(16, AVAILABLE_CPUS))
+        self.workers_spin.setValue(AVAILABLE_CPUS)
+        self.workers_spin.setEnabled(False)
+        self.workers_spin.setToolTip("Number of parallel conversion processes")
         perf_layout.addWidget(self.workers_spin, 0, 1)
         
+        self.auto_workers_check = QCheckBox(f"Auto ({AVAILABLE_CPUS} CPUs detected)")
+        self.auto_workers_check.setChecked(True)
+        self.auto_workers_check.setToolTip("One worker per CPU, limited by free memory when psutil is installed")
+        self.auto_workers_check.toggled.connect(self.on_auto_workers_toggled)
+        perf_layout.addWidget(self.auto_workers_check, 0, 2)
+        
         layout.addWidget(perf_group)
         
         # About section
         about_group = QGroupBox("ℹ️ About")
         about_layout = QVBoxLayout(about_group)
         
-        about_text = QLabel(
-            f"<h3>{APP_NAME}</h3>"
-            f"<p>Version: {APP_VERSION}</p>"
-            f"<p>A modern, feature-rich image converter with support for multiple formats.</p>"
-            f"<p><a href='{GITHUB_URL}' style='color: #58a6ff;'>GitHub Repository</a></p>"
-            f"<p>Made with ❤️ by Leonardo Vianna</p>"
-        )
+        about_text = QLabel(_ABOUT_HTML)
         about_text.setOpenExternalLinks(True)
         about_text.setWordWrap(True)
         about_layout.addWidget(about_text)
@@ -1054,17 +2028,14 @@ class ImageConverterPro(QMainWindow):
         layout.addStretch()
         self.tabs.addTab(tab, "⚙️ Settings")
     
-    def create_history_tab(self):
+    def create_history_tab(self) -> QWidget:
         """Create the conversion history tab."""
         tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # History table
-        self.history_table = QTableWidget()
-        self.history_table.setColumnCount(5)
-        self.history_table.setHorizontalHeaderLabels([
-            "Date/Time", "Files", "Format", "Space Saved", "Status"
-        ])
+        self.history_table = QTableView()
+        self.history_table.setModel(self.history_model)
         self.history_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         layout.addWidget(self.history_table)
         
@@ -1074,7 +2045,7 @@ class ImageConverterPro(QMainWindow):
         clear_btn.clicked.connect(self.clear_history)
         layout.addWidget(clear_btn)
         
-        self.tabs.addTab(tab, "📜 History")
+        return tab
     
     # ═══════════════════════════════════════════════════════════════════════════
     # EVENT HANDLERS
@@ -1106,7 +2077,7 @@ class ImageConverterPro(QMainWindow):
         """Browse for image info file."""
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Select Image",
-            "", "Images (*.png *.jpg *.jpeg *.webp *.bmp *.gif *.tiff)"
+            "", IMAGE_FILE_FILTER
         )
         if file_path:
             self.info_file_input.setText(file_path)
@@ -1128,6 +2099,16 @@ class ImageConverterPro(QMainWindow):
         self.quality_slider.setEnabled(config.get('quality', False))
         if not config.get('quality', False):
             self.quality_label.setText("N/A")
+        self.png_level_spin.setEnabled(format_name == 'PNG')
+        self.png_palette_check.setEnabled(format_name == 'PNG')
+        self.webp_method_spin.setEnabled(format_name == 'WebP')
+        self.webp_lossless_check.setEnabled(format_name == 'WebP')
+    
+    def on_auto_workers_toggled(self, checked):
+        """Handle Auto workers checkbox toggle."""
+        self.workers_spin.setEnabled(not checked)
+        if checked:
+            self.workers_spin.setValue(AVAILABLE_CPUS)
     
     def on_resize_toggled(self, checked):
         """Handle resize checkbox toggle."""
@@ -1137,19 +2118,46 @@ class ImageConverterPro(QMainWindow):
     
     def log_message(self, message: str, msg_type: str = "info"):
         """Add message to log area with color coding."""
-        colors = {
-            "info": "#58a6ff",
-            "success": "#3fb950",
-            "error": "#f85149",
-            "warning": "#d29922"
-        }
-        color = colors.get(msg_type, "#c9d1d9")
-        self.log_area.append(f'<span style="color: {color};">{message}</span>')
+        color = LOG_COLORS.get(msg_type, "#c9d1d9")
+        self._log_buffer.append(f'<span style="color: {color};">{message}</span>')
+        self._schedule_log_flush()
+    
+    def on_log_batch(self, batch: List[Tuple[str, str]]):
+        """Queue a batch of worker log lines for the log area."""
+        self._log_buffer.extend(
+            f'<span style="color: {LOG_COLORS.get(msg_type, "#c9d1d9")};">{message}</span>'
+            for message, msg_type in batch
+        )
+        self._schedule_log_flush()
+    
+    def _schedule_log_flush(self):
+        """Flush the queued log lines shortly, unless a flush is already pending."""
+        if not self._log_scheduled:
+            self._log_scheduled = True
+            QTimer.singleShot(LOG_VIEW_DELAY_MS, self._flush_log)
+    
+    def _flush_log(self):
+        """Write all queued log lines with one insertHtml, then scroll once."""
+        self._log_scheduled = False
+        if not self._log_buffer:
+            return
+        
+        html = '<br>'.join(self._log_buffer)
+        self._log_buffer.clear()
+        if not self.log_area.document().isEmpty():
+            html = '<br>' + html
+        self.log_area.moveCursor(QTextCursor.End)
+        self.log_area.insertHtml(html)
         
         # Auto-scroll to bottom
         scrollbar = self.log_area.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
     
+    def clear_log(self):
+        """Clear the log area, including lines not shown yet."""
+        self._log_buffer.clear()
+        self.log_area.clear()
+    
     def start_conversion(self):
         """Start the conversion process."""
         directory = self.dir_input.text()
@@ -1171,10 +2179,17 @@ class ImageConverterPro(QMainWindow):
         self.settings.maintain_aspect_ratio = self.aspect_ratio_check.isChecked()
         self.settings.output_directory = self.output_dir_input.text()
         self.settings.add_suffix = self.suffix_input.text()
-        self.settings.max_workers = self.workers_spin.value()
+        self.settings.auto_workers = self.auto_workers_check.isChecked()
+        self.settings.max_workers = (AVAILABLE_CPUS if self.settings.auto_workers
+                                     else self.workers_spin.value())
+        self.settings.png_compress_level = self.png_level_spin.value()
+        self.settings.png_palette = self.png_palette_check.isChecked()
+        self.settings.webp_method = self.webp_method_spin.value()
+        self.settings.webp_lossless = self.webp_lossless_check.isChecked()
+        self.settings.skip_duplicates = self.skip_duplicates_check.isChecked()
         
         # Clear log and reset progress
-        self.log_area.clear()
+        self.clear_log()
         self.progress_bar.setValue(0)
         self.total_saved = 0
         self.start_time = datetime.now()
@@ -1185,13 +2200,40 @@ class ImageConverterPro(QMainWindow):
         self.statusBar.showMessage("Converting...")
         
         # Create and start worker
-        self.worker = ConversionWorker(directory, self.settings)
+        self.worker = ConversionWorker(directory, self.settings, self._get_process_pool())
         self.worker.progress.connect(self.on_progress)
         self.worker.log_message.connect(self.log_message)
+        self.worker.log_batch.connect(self.on_log_batch)
         self.worker.conversion_complete.connect(self.on_conversion_complete)
         self.worker.file_converted.connect(self.on_file_converted)
         self.worker.start()
     
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Return the long-lived process pool, restarting it if the worker count changed."""
+        # Never restarted under a running conversion, which may be submitting to it
+        workers = self.settings.max_workers
+        converting = self.worker is not None and self.worker.isRunning()
+        if self._pool is None or (self._pool_workers != workers and not converting):
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
+            # Processes are only spawned once tasks are submitted
+            self._pool = _create_process_pool(workers)
+            self._pool_workers = workers
+        return self._pool
+    
+    def closeEvent(self, event):
+        """Stop any running conversion and release the worker processes."""
+        if self.worker and self.worker.isRunning():
+            self.worker.cancel()
+            self.worker.wait()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+        for worker in (self.rename_worker, self.duplicate_worker):
+            if worker is not None:
+                worker.wait()
+        super().closeEvent(event)
+    
     def cancel_conversion(self):
         """Cancel the conversion process."""
         if self.worker:
@@ -1199,7 +2241,18 @@ class ImageConverterPro(QMainWindow):
             self.log_message("🛑 Cancelling conversion...", "warning")
     
     def on_progress(self, current: int, total: int):
-        """Handle progress update."""
+        """Handle progress update, repainting at most every PROGRESS_INTERVAL_MS."""
+        self._pending_progress = (current, total)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+    
+    def _apply_progress(self):
+        """Show the latest progress update."""
+        if self._pending_progress is None:
+            return
+        current, total = self._pending_progress
+        self._pending_progress = None
+        
         percentage = int((current / total) * 100) if total > 0 else 0
         self.progress_bar.setValue(percentage)
         self.files_label.setText(f"Files: {current}/{total}")
@@ -1216,6 +2269,10 @@ class ImageConverterPro(QMainWindow):
     
     def on_conversion_complete(self, results: List[ConversionResult]):
         """Handle conversion completion."""
+        # Show the final count even if the last update is still throttled
+        self._progress_timer.stop()
+        self._apply_progress()
+        
         # Update UI state
         self.convert_btn.setEnabled(True)
         self.cancel_btn.setEnabled(False)
@@ -1245,28 +2302,17 @@ class ImageConverterPro(QMainWindow):
         successful = sum(1 for r in results if r.success)
         total_saved = sum(r.size_saved for r in results if r.success)
         
-        row = self.history_table.rowCount()
-        self.history_table.insertRow(row)
-        
-        self.history_table.setItem(row, 0, QTableWidgetItem(
-            datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        ))
-        self.history_table.setItem(row, 1, QTableWidgetItem(
-            f"{successful}/{len(results)}"
-        ))
-        self.history_table.setItem(row, 2, QTableWidgetItem(
-            f"{self.settings.input_format} → {self.settings.output_format}"
-        ))
-        self.history_table.setItem(row, 3, QTableWidgetItem(
-            f"{total_saved / 1024 / 1024:.2f} MB"
-        ))
-        self.history_table.setItem(row, 4, QTableWidgetItem(
-            "✅ Success" if successful == len(results) else "⚠️ Partial"
+        self.history_model.append_row((
+            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            f"{successful}/{len(results)}",
+            f"{self.settings.input_format} → {self.settings.output_format}",
+            f"{total_saved / 1024 / 1024:.2f} MB",
+            "✅ Success" if successful == len(results) else "⚠️ Partial",
         ))
     
     def clear_history(self):
         """Clear conversion history."""
-        self.history_table.setRowCount(0)
+        self.history_model.clear()
     
     def batch_rename(self):
         """Perform batch rename operation."""
@@ -1281,29 +2327,28 @@ class ImageConverterPro(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please enter a rename pattern.")
             return
         
-        try:
-            path = Path(directory)
-            extensions = ['.png', '.jpg', '.jpeg', '.webp', '.bmp', '.gif', '.tiff']
-            files = [f for f in path.iterdir() if f.suffix.lower() in extensions]
-            
-            counter = 1
-            for file in sorted(files):
-                new_name = pattern
-                new_name = new_name.replace('{name}', file.stem)
-                new_name = new_name.replace('{date}', datetime.now().strftime('%Y%m%d'))
-                new_name = new_name.replace('{time}', datetime.now().strftime('%H%M%S'))
-                new_name = new_name.replace('{counter}', str(counter).zfill(4))
-                
-                new_path = file.parent / f"{new_name}{file.suffix}"
-                file.rename(new_path)
-                counter += 1
-            
-            QMessageBox.information(
-                self, "Success",
-                f"Successfully renamed {counter - 1} files."
-            )
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Rename failed: {str(e)}")
+        self.rename_btn.setEnabled(False)
+        self.statusBar.showMessage("Renaming files...")
+        
+        self.rename_worker = RenameWorker(directory, pattern)
+        self.rename_worker.rename_complete.connect(self.on_rename_complete)
+        self.rename_worker.error.connect(self.on_rename_error)
+        self.rename_worker.start()
+    
+    def on_rename_complete(self, renamed: int):
+        """Handle batch rename completion."""
+        self.rename_btn.setEnabled(True)
+        self.statusBar.showMessage(f"Renamed {renamed} files")
+        QMessageBox.information(
+            self, "Success",
+            f"Successfully renamed {renamed} files."
+        )
+    
+    def on_rename_error(self, message: str):
+        """Handle a failed batch rename."""
+        self.rename_btn.setEnabled(True)
+        self.statusBar.showMessage("Rename failed")
+        QMessageBox.critical(self, "Error", f"Rename failed: {message}")
     
     def find_duplicates(self):
         """Find duplicate images in directory."""
@@ -1314,76 +2359,91 @@ class ImageConverterPro(QMainWindow):
             return
         
         self.duplicate_list.clear()
-        hash_dict: Dict[str, List[Path]] = {}
         
-        try:
-            path = Path(directory)
-            extensions = ['.png', '.jpg', '.jpeg', '.webp', '.bmp', '.gif', '.tiff']
-            
-            for file in path.rglob('*'):
-                if file.suffix.lower() in extensions:
-                    file_hash = self.get_file_hash(file)
-                    if file_hash in hash_dict:
-                        hash_dict[file_hash].append(file)
-                    else:
-                        hash_dict[file_hash] = [file]
-            
-            duplicates_found = 0
-            for files in hash_dict.values():
-                if len(files) > 1:
-                    duplicates_found += 1
-                    self.duplicate_list.addItem(f"─── Duplicate Group {duplicates_found} ───")
-                    for f in files:
-                        item = QListWidgetItem(f"  📄 {f.name}")
-                        item.setToolTip(str(f))
-                        self.duplicate_list.addItem(item)
-            
-            if duplicates_found == 0:
-                self.duplicate_list.addItem("✅ No duplicates found!")
-            else:
-                self.duplicate_list.insertItem(
-                    0, f"Found {duplicates_found} groups of duplicate files"
-                )
-                
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Search failed: {str(e)}")
+        self.find_dup_btn.setEnabled(False)
+        self.statusBar.showMessage("Scanning for duplicates...")
+        
+        # The worker checks the tree against the last scan itself, so this
+        # thread never walks the directory
+        similar = self.similar_check.isChecked()
+        self.duplicate_worker = DuplicateFinderWorker(
+            directory, self.workers_spin.value(), similar,
+            self._get_process_pool() if similar else None, self._dup_cache
+        )
+        self.duplicate_worker.progress.connect(self.on_duplicate_progress)
+        self.duplicate_worker.duplicates_found.connect(self.on_duplicates_found)
+        self.duplicate_worker.error.connect(self.on_duplicate_error)
+        self.duplicate_worker.start()
+    
+    def on_duplicate_progress(self, hashed: int, total: int):
+        """Handle duplicate finder progress."""
+        self.statusBar.showMessage(f"Hashing candidates: {hashed}/{total}")
+    
+    def on_duplicates_found(self, groups: List[List[str]], key: Optional[tuple]):
+        """Show the groups of duplicate files."""
+        self.find_dup_btn.setEnabled(True)
+        if key is not None:
+            self._dup_cache = (key, groups)
+        
+        # Rows are built first and added in one call, so the list lays out once
+        duplicates_found = len(groups)
+        if duplicates_found == 0:
+            labels = ["✅ No duplicates found!"]
+        else:
+            labels = [f"Found {duplicates_found} groups of duplicate files"]
+        tooltips = {}
+        for number, group in enumerate(groups, 1):
+            labels.append(f"─── Duplicate Group {number} ───")
+            for f in group:
+                tooltips[len(labels)] = f
+                labels.append(f"  📄 {os.path.basename(f)}")
+        
+        self.duplicate_list.setUpdatesEnabled(False)
+        self.duplicate_list.blockSignals(True)
+        self.duplicate_list.addItems(labels)
+        for row, path in tooltips.items():
+            self.duplicate_list.item(row).setToolTip(path)
+        self.duplicate_list.blockSignals(False)
+        self.duplicate_list.setUpdatesEnabled(True)
+        self.statusBar.showMessage(f"Duplicate scan complete: {duplicates_found} groups found")
+    
+    def on_duplicate_error(self, message: str):
+        """Handle a failed duplicate scan."""
+        self.find_dup_btn.setEnabled(True)
+        self.statusBar.showMessage("Duplicate scan failed")
+        QMessageBox.critical(self, "Error", f"Search failed: {message}")
     
     def get_file_hash(self, file_path: Path) -> str:
-        """Calculate MD5 hash of file."""
-        hasher = hashlib.md5()
-        with open(file_path, 'rb') as f:
-            # Read in chunks for large files
-            for chunk in iter(lambda: f.read(4096), b""):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+        """Calculate BLAKE2b hash of file."""
+        return _full_hash(str(file_path)).hex()
     
     def show_image_info(self, file_path: str):
         """Display image information."""
         try:
-            self.info_table.setRowCount(0)
-            path = Path(file_path)
+            self.info_model.clear()
+            st = os.stat(file_path)
             
-            with Image.open(path) as img:
+            # Image.open only parses the header, which is all that is shown here
+            with Image.open(file_path) as img:
                 info = [
-                    ("Filename", path.name),
+                    ("Filename", os.path.basename(file_path)),
                     ("Format", img.format or "Unknown"),
                     ("Mode", img.mode),
                     ("Size", f"{img.width} × {img.height} pixels"),
-                    ("File Size", f"{path.stat().st_size / 1024:.2f} KB"),
+                    ("File Size", f"{st.st_size / 1024:.2f} KB"),
+                    ("Modified", datetime.fromtimestamp(st.st_mtime).strftime("%Y-%m-%d %H:%M:%S")),
                     ("Megapixels", f"{(img.width * img.height) / 1_000_000:.2f} MP"),
                 ]
                 
-                # Add EXIF data if available
-                if hasattr(img, '_getexif') and img._getexif():
-                    exif = img._getexif()
-                    if exif:
-                        info.append(("EXIF Data", "Available"))
+                # Add EXIF data if available. getexif() only reads the IFD0 tags
+                # (no sub-IFD walk), and is skipped outright for other formats.
+                # A TIFF's IFD0 always holds its own layout tags, so there only
+                # the pointer to an Exif sub-IFD (0x8769) counts
+                exif = img.getexif() if img.format in EXIF_FORMATS else None
+                if exif and (img.format != 'TIFF' or 0x8769 in exif):
+                    info.append(("EXIF Data", "Available"))
                 
-                for prop, value in info:
-                    row = self.info_table.rowCount()
-                    self.info_table.insertRow(row)
-                    self.info_table.setItem(row, 0, QTableWidgetItem(prop))
-                    self.info_table.setItem(row, 1, QTableWidgetItem(str(value)))
+                self.info_model.set_rows([(prop, str(value)) for prop, value in info])
                     
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not read image: {str(e)}")
@@ -1399,6 +2459,9 @@ def main():
         print("Error: Pillow library is required. Install with: pip install Pillow")
         sys.exit(1)
     
+    # Required for the process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
+    
     # Enable high DPI scaling
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
@@ -1406,6 +2469,7 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName(APP_NAME)
     app.setApplicationVersion(APP_VERSION)
+    app.setStyleSheet(_DARK_THEME_MIN)
     
     # Set application icon (if available)
     # app.setWindowIcon(QIcon('icon.png'))
@@ -0,0 +1,17 @@
+"""Build opcional: compila a lógica por arquivo do conversor WebP com mypyc.
+
+    pip install mypy
+    python setup.py build_ext --inplace
+
+Gera uma extensão nativa conversor_worker.*.so/.pyd ao lado do fonte; quando ela
+existe, o Python a importa no lugar de conversor_worker.py. A interface Tk
+(conversor_webp.py) continua em Python puro.
+"""
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name='conversor-webp-worker',
+    py_modules=[],
+    ext_modules=mypycify(['conversor_worker.py']),
+)